@@ -1,10 +1,266 @@
 package main
 
+/*
+#include <stdint.h>
+#include <string.h>
+
+// =============================================================================
+// HARDWARE AES (AES-NI x86 / ARMv8 Crypto Extension)
+// =============================================================================
+// Cipher di sini bukan AES standar (38 round, key 1024-bit), jadi crypto/aes
+// tidak bisa dipakai. Tapi 1 round-nya identik dengan round AES biasa, jadi
+// instruksi AESDEC/AESD tetap bisa dipakai dengan round key custom
+// (Equivalent Inverse Cipher: round key tengah di-InvMixColumns dulu).
+#if defined(__x86_64__) || defined(__i386__)
+#include <cpuid.h>
+#include <wmmintrin.h>
+#define SOLVER_AES_X86 1
+#elif defined(__aarch64__) && (defined(__ARM_FEATURE_CRYPTO) || defined(__ARM_FEATURE_AES))
+#include <arm_neon.h>
+#include <sys/auxv.h>
+#include <asm/hwcap.h>
+#define SOLVER_AES_ARM 1
+#endif
+
+// Build `go build -tags aesni ...`: AES-NI dianggap pasti ada (seperti make AESNI=1),
+// cek hwAES di hot path hilang saat compile (lihat aesForced). CPUID tetap dicek 1x
+// saat load supaya CPU tanpa AES-NI gagal dengan pesan jelas, bukan SIGILL.
+#cgo aesni CFLAGS: -DSOLVER_AESNI=1
+#ifndef SOLVER_AESNI
+#define SOLVER_AESNI 0
+#endif
+#if SOLVER_AESNI && !defined(SOLVER_AES_X86)
+#error "-tags aesni hanya untuk x86 (AES-NI)"
+#endif
+
+static int solver_cpu_has_aes(void) {
+#if defined(SOLVER_AES_X86)
+	unsigned int a, b, c, d;
+	if (!__get_cpuid(1, &a, &b, &c, &d)) return 0;
+	return (c & bit_AES) != 0;
+#elif defined(SOLVER_AES_ARM)
+	return (getauxval(AT_HWCAP) & HWCAP_AES) != 0;
+#else
+	return 0;
+#endif
+}
+
+#if defined(SOLVER_AES_X86)
+// dk[r] = InvMixColumns(rk[r]) untuk round 1..rounds-1, dk[0]/dk[rounds] = apa adanya
+__attribute__((target("aes,sse2")))
+static void solver_aes_prepare_dec(const uint8_t *rk, int rounds, uint8_t *dk) {
+	_mm_storeu_si128((__m128i *)dk, _mm_loadu_si128((const __m128i *)rk));
+	for (int r = 1; r < rounds; r++)
+		_mm_storeu_si128((__m128i *)(dk + 16*r), _mm_aesimc_si128(_mm_loadu_si128((const __m128i *)(rk + 16*r))));
+	_mm_storeu_si128((__m128i *)(dk + 16*rounds), _mm_loadu_si128((const __m128i *)(rk + 16*rounds)));
+}
+
+__attribute__((target("aes,sse2")))
+static void solver_aes_dec_cbc(const uint8_t *dk, int rounds, const uint8_t *iv, const uint8_t *in, uint8_t *out, int nblocks) {
+	__m128i prev = _mm_loadu_si128((const __m128i *)iv);
+	for (int b = 0; b < nblocks; b++) {
+		__m128i c = _mm_loadu_si128((const __m128i *)(in + 16*b));
+		__m128i s = _mm_xor_si128(c, _mm_loadu_si128((const __m128i *)(dk + 16*rounds)));
+		for (int r = rounds - 1; r > 0; r--)
+			s = _mm_aesdec_si128(s, _mm_loadu_si128((const __m128i *)(dk + 16*r)));
+		s = _mm_aesdeclast_si128(s, _mm_loadu_si128((const __m128i *)dk));
+		_mm_storeu_si128((__m128i *)(out + 16*b), _mm_xor_si128(s, prev));
+		prev = c;
+	}
+}
+#elif defined(SOLVER_AES_ARM)
+static void solver_aes_prepare_dec(const uint8_t *rk, int rounds, uint8_t *dk) {
+	vst1q_u8(dk, vld1q_u8(rk));
+	for (int r = 1; r < rounds; r++) vst1q_u8(dk + 16*r, vaesimcq_u8(vld1q_u8(rk + 16*r)));
+	vst1q_u8(dk + 16*rounds, vld1q_u8(rk + 16*rounds));
+}
+
+// AESD = AddRoundKey + InvShiftRows + InvSubBytes, AESIMC = InvMixColumns
+static void solver_aes_dec_cbc(const uint8_t *dk, int rounds, const uint8_t *iv, const uint8_t *in, uint8_t *out, int nblocks) {
+	uint8x16_t prev = vld1q_u8(iv);
+	for (int b = 0; b < nblocks; b++) {
+		uint8x16_t c = vld1q_u8(in + 16*b);
+		uint8x16_t s = c;
+		for (int r = rounds; r > 1; r--) s = vaesimcq_u8(vaesdq_u8(s, vld1q_u8(dk + 16*r)));
+		s = veorq_u8(vaesdq_u8(s, vld1q_u8(dk + 16)), vld1q_u8(dk));
+		vst1q_u8(out + 16*b, veorq_u8(s, prev));
+		prev = c;
+	}
+}
+#else
+static void solver_aes_prepare_dec(const uint8_t *rk, int rounds, uint8_t *dk) {}
+static void solver_aes_dec_cbc(const uint8_t *dk, int rounds, const uint8_t *iv, const uint8_t *in, uint8_t *out, int nblocks) {}
+#endif
+
+// =============================================================================
+// SIMD MD5 CHAIN (AVX2, 8 LANE)
+// =============================================================================
+// KDF mengulang MD5 atas digest 16 byte 9999x per blok (~90% waktu derive).
+// Pesan 16 byte selalu muat 1 blok MD5 dengan padding tetap (0x80, panjang 128 bit),
+// jadi 8 password dihitung bareng: 1 register ymm = 1 word state untuk 8 lane.
+#if defined(__x86_64__)
+#include <immintrin.h>
+#define SOLVER_MD5_X8 1
+#endif
+
+static int solver_cpu_has_avx2(void) {
+#if defined(SOLVER_MD5_X8)
+	__builtin_cpu_init();
+	return __builtin_cpu_supports("avx2");
+#else
+	return 0;
+#endif
+}
+
+#if defined(SOLVER_MD5_X8)
+#define MD5_ROTL(x, s) _mm256_or_si256(_mm256_slli_epi32((x), (s)), _mm256_srli_epi32((x), 32 - (s)))
+#define MD5_F(b, c, d) _mm256_xor_si256(d, _mm256_and_si256(b, _mm256_xor_si256(c, d)))
+#define MD5_G(b, c, d) _mm256_xor_si256(c, _mm256_and_si256(d, _mm256_xor_si256(b, c)))
+#define MD5_H(b, c, d) _mm256_xor_si256(_mm256_xor_si256(b, c), d)
+#define MD5_I(b, c, d) _mm256_xor_si256(c, _mm256_or_si256(b, _mm256_xor_si256(d, ones)))
+// a = b + rotl(a + f(b,c,d) + m + k, s); STEPZ = word pesan nol (padding)
+#define MD5_STEP(f, a, b, c, d, m, k, s) \
+	a = _mm256_add_epi32(b, MD5_ROTL(_mm256_add_epi32(_mm256_add_epi32(a, f(b, c, d)), _mm256_add_epi32(m, _mm256_set1_epi32((int)(k)))), s))
+#define MD5_STEPZ(f, a, b, c, d, k, s) \
+	a = _mm256_add_epi32(b, MD5_ROTL(_mm256_add_epi32(_mm256_add_epi32(a, f(b, c, d)), _mm256_set1_epi32((int)(k))), s))
+
+// dig = 8 digest berurutan (8 x 16 byte); tiap lane: dig = MD5(dig), diulang iters kali
+__attribute__((target("avx2")))
+static void solver_md5_chain_x8(uint8_t *dig, int iters) {
+	const __m256i ones = _mm256_set1_epi32(-1);
+	const __m256i iva = _mm256_set1_epi32(0x67452301), ivb = _mm256_set1_epi32((int)0xefcdab89);
+	const __m256i ivc = _mm256_set1_epi32((int)0x98badcfe), ivd = _mm256_set1_epi32(0x10325476);
+	const __m256i m4 = _mm256_set1_epi32(0x80), m14 = _mm256_set1_epi32(128);
+	const __m256i idx = _mm256_setr_epi32(0, 4, 8, 12, 16, 20, 24, 28); // stride 16 byte antar lane
+	__m256i w0 = _mm256_i32gather_epi32((const int *)(dig + 0), idx, 4);
+	__m256i w1 = _mm256_i32gather_epi32((const int *)(dig + 4), idx, 4);
+	__m256i w2 = _mm256_i32gather_epi32((const int *)(dig + 8), idx, 4);
+	__m256i w3 = _mm256_i32gather_epi32((const int *)(dig + 12), idx, 4);
+	for (int it = 0; it < iters; it++) {
+		__m256i a = iva, b = ivb, c = ivc, d = ivd;
+		MD5_STEP(MD5_F, a, b, c, d, w0, 0xd76aa478, 7); MD5_STEP(MD5_F, d, a, b, c, w1, 0xe8c7b756, 12); MD5_STEP(MD5_F, c, d, a, b, w2, 0x242070db, 17); MD5_STEP(MD5_F, b, c, d, a, w3, 0xc1bdceee, 22);
+		MD5_STEP(MD5_F, a, b, c, d, m4, 0xf57c0faf, 7); MD5_STEPZ(MD5_F, d, a, b, c, 0x4787c62a, 12); MD5_STEPZ(MD5_F, c, d, a, b, 0xa8304613, 17); MD5_STEPZ(MD5_F, b, c, d, a, 0xfd469501, 22);
+		MD5_STEPZ(MD5_F, a, b, c, d, 0x698098d8, 7); MD5_STEPZ(MD5_F, d, a, b, c, 0x8b44f7af, 12); MD5_STEPZ(MD5_F, c, d, a, b, 0xffff5bb1, 17); MD5_STEPZ(MD5_F, b, c, d, a, 0x895cd7be, 22);
+		MD5_STEPZ(MD5_F, a, b, c, d, 0x6b901122, 7); MD5_STEPZ(MD5_F, d, a, b, c, 0xfd987193, 12); MD5_STEP(MD5_F, c, d, a, b, m14, 0xa679438e, 17); MD5_STEPZ(MD5_F, b, c, d, a, 0x49b40821, 22);
+		MD5_STEP(MD5_G, a, b, c, d, w1, 0xf61e2562, 5); MD5_STEPZ(MD5_G, d, a, b, c, 0xc040b340, 9); MD5_STEPZ(MD5_G, c, d, a, b, 0x265e5a51, 14); MD5_STEP(MD5_G, b, c, d, a, w0, 0xe9b6c7aa, 20);
+		MD5_STEPZ(MD5_G, a, b, c, d, 0xd62f105d, 5); MD5_STEPZ(MD5_G, d, a, b, c, 0x02441453, 9); MD5_STEPZ(MD5_G, c, d, a, b, 0xd8a1e681, 14); MD5_STEP(MD5_G, b, c, d, a, m4, 0xe7d3fbc8, 20);
+		MD5_STEPZ(MD5_G, a, b, c, d, 0x21e1cde6, 5); MD5_STEP(MD5_G, d, a, b, c, m14, 0xc33707d6, 9); MD5_STEP(MD5_G, c, d, a, b, w3, 0xf4d50d87, 14); MD5_STEPZ(MD5_G, b, c, d, a, 0x455a14ed, 20);
+		MD5_STEPZ(MD5_G, a, b, c, d, 0xa9e3e905, 5); MD5_STEP(MD5_G, d, a, b, c, w2, 0xfcefa3f8, 9); MD5_STEPZ(MD5_G, c, d, a, b, 0x676f02d9, 14); MD5_STEPZ(MD5_G, b, c, d, a, 0x8d2a4c8a, 20);
+		MD5_STEPZ(MD5_H, a, b, c, d, 0xfffa3942, 4); MD5_STEPZ(MD5_H, d, a, b, c, 0x8771f681, 11); MD5_STEPZ(MD5_H, c, d, a, b, 0x6d9d6122, 16); MD5_STEP(MD5_H, b, c, d, a, m14, 0xfde5380c, 23);
+		MD5_STEP(MD5_H, a, b, c, d, w1, 0xa4beea44, 4); MD5_STEP(MD5_H, d, a, b, c, m4, 0x4bdecfa9, 11); MD5_STEPZ(MD5_H, c, d, a, b, 0xf6bb4b60, 16); MD5_STEPZ(MD5_H, b, c, d, a, 0xbebfbc70, 23);
+		MD5_STEPZ(MD5_H, a, b, c, d, 0x289b7ec6, 4); MD5_STEP(MD5_H, d, a, b, c, w0, 0xeaa127fa, 11); MD5_STEP(MD5_H, c, d, a, b, w3, 0xd4ef3085, 16); MD5_STEPZ(MD5_H, b, c, d, a, 0x04881d05, 23);
+		MD5_STEPZ(MD5_H, a, b, c, d, 0xd9d4d039, 4); MD5_STEPZ(MD5_H, d, a, b, c, 0xe6db99e5, 11); MD5_STEPZ(MD5_H, c, d, a, b, 0x1fa27cf8, 16); MD5_STEP(MD5_H, b, c, d, a, w2, 0xc4ac5665, 23);
+		MD5_STEP(MD5_I, a, b, c, d, w0, 0xf4292244, 6); MD5_STEPZ(MD5_I, d, a, b, c, 0x432aff97, 10); MD5_STEP(MD5_I, c, d, a, b, m14, 0xab9423a7, 15); MD5_STEPZ(MD5_I, b, c, d, a, 0xfc93a039, 21);
+		MD5_STEPZ(MD5_I, a, b, c, d, 0x655b59c3, 6); MD5_STEP(MD5_I, d, a, b, c, w3, 0x8f0ccc92, 10); MD5_STEPZ(MD5_I, c, d, a, b, 0xffeff47d, 15); MD5_STEP(MD5_I, b, c, d, a, w1, 0x85845dd1, 21);
+		MD5_STEPZ(MD5_I, a, b, c, d, 0x6fa87e4f, 6); MD5_STEPZ(MD5_I, d, a, b, c, 0xfe2ce6e0, 10); MD5_STEPZ(MD5_I, c, d, a, b, 0xa3014314, 15); MD5_STEPZ(MD5_I, b, c, d, a, 0x4e0811a1, 21);
+		MD5_STEP(MD5_I, a, b, c, d, m4, 0xf7537e82, 6); MD5_STEPZ(MD5_I, d, a, b, c, 0xbd3af235, 10); MD5_STEP(MD5_I, c, d, a, b, w2, 0x2ad7d2bb, 15); MD5_STEPZ(MD5_I, b, c, d, a, 0xeb86d391, 21);
+		w0 = _mm256_add_epi32(a, iva); w1 = _mm256_add_epi32(b, ivb);
+		w2 = _mm256_add_epi32(c, ivc); w3 = _mm256_add_epi32(d, ivd);
+	}
+	uint32_t out[4][8];
+	_mm256_storeu_si256((__m256i *)out[0], w0); _mm256_storeu_si256((__m256i *)out[1], w1);
+	_mm256_storeu_si256((__m256i *)out[2], w2); _mm256_storeu_si256((__m256i *)out[3], w3);
+	for (int l = 0; l < 8; l++)
+		for (int j = 0; j < 4; j++) {
+			uint32_t v = out[j][l];
+			dig[16*l + 4*j] = v; dig[16*l + 4*j + 1] = v >> 8; dig[16*l + 4*j + 2] = v >> 16; dig[16*l + 4*j + 3] = v >> 24;
+		}
+}
+#else
+static void solver_md5_chain_x8(uint8_t *dig, int iters) {}
+#endif
+
+// =============================================================================
+// SIMD SHA-512 CHAIN (AVX2, 4 LANE)
+// =============================================================================
+// SHA-NI cuma ada untuk SHA-1/SHA-256; KDF ini pakai SHA-512 (11513x atas digest 64 byte).
+// Setelah MD5 jalan 8 lane, chain SHA-512 jadi porsi terbesar waktu derive. Input 64 byte
+// selalu 1 blok dengan padding tetap (0x80.., panjang 512 bit), jadi 4 password dihitung
+// bareng: 1 register ymm = 1 word 64-bit state untuk 4 lane.
+#if defined(SOLVER_MD5_X8)
+#define SOLVER_SHA512_X4 1
+static const uint64_t solver_sha512_k[80] = {
+	0x428a2f98d728ae22ULL, 0x7137449123ef65cdULL, 0xb5c0fbcfec4d3b2fULL, 0xe9b5dba58189dbbcULL,
+	0x3956c25bf348b538ULL, 0x59f111f1b605d019ULL, 0x923f82a4af194f9bULL, 0xab1c5ed5da6d8118ULL,
+	0xd807aa98a3030242ULL, 0x12835b0145706fbeULL, 0x243185be4ee4b28cULL, 0x550c7dc3d5ffb4e2ULL,
+	0x72be5d74f27b896fULL, 0x80deb1fe3b1696b1ULL, 0x9bdc06a725c71235ULL, 0xc19bf174cf692694ULL,
+	0xe49b69c19ef14ad2ULL, 0xefbe4786384f25e3ULL, 0x0fc19dc68b8cd5b5ULL, 0x240ca1cc77ac9c65ULL,
+	0x2de92c6f592b0275ULL, 0x4a7484aa6ea6e483ULL, 0x5cb0a9dcbd41fbd4ULL, 0x76f988da831153b5ULL,
+	0x983e5152ee66dfabULL, 0xa831c66d2db43210ULL, 0xb00327c898fb213fULL, 0xbf597fc7beef0ee4ULL,
+	0xc6e00bf33da88fc2ULL, 0xd5a79147930aa725ULL, 0x06ca6351e003826fULL, 0x142929670a0e6e70ULL,
+	0x27b70a8546d22ffcULL, 0x2e1b21385c26c926ULL, 0x4d2c6dfc5ac42aedULL, 0x53380d139d95b3dfULL,
+	0x650a73548baf63deULL, 0x766a0abb3c77b2a8ULL, 0x81c2c92e47edaee6ULL, 0x92722c851482353bULL,
+	0xa2bfe8a14cf10364ULL, 0xa81a664bbc423001ULL, 0xc24b8b70d0f89791ULL, 0xc76c51a30654be30ULL,
+	0xd192e819d6ef5218ULL, 0xd69906245565a910ULL, 0xf40e35855771202aULL, 0x106aa07032bbd1b8ULL,
+	0x19a4c116b8d2d0c8ULL, 0x1e376c085141ab53ULL, 0x2748774cdf8eeb99ULL, 0x34b0bcb5e19b48a8ULL,
+	0x391c0cb3c5c95a63ULL, 0x4ed8aa4ae3418acbULL, 0x5b9cca4f7763e373ULL, 0x682e6ff3d6b2b8a3ULL,
+	0x748f82ee5defb2fcULL, 0x78a5636f43172f60ULL, 0x84c87814a1f0ab72ULL, 0x8cc702081a6439ecULL,
+	0x90befffa23631e28ULL, 0xa4506cebde82bde9ULL, 0xbef9a3f7b2c67915ULL, 0xc67178f2e372532bULL,
+	0xca273eceea26619cULL, 0xd186b8c721c0c207ULL, 0xeada7dd6cde0eb1eULL, 0xf57d4f7fee6ed178ULL,
+	0x06f067aa72176fbaULL, 0x0a637dc5a2c898a6ULL, 0x113f9804bef90daeULL, 0x1b710b35131c471bULL,
+	0x28db77f523047d84ULL, 0x32caab7b40c72493ULL, 0x3c9ebe0a15c9bebcULL, 0x431d67c49c100d4cULL,
+	0x4cc5d4becb3e42b6ULL, 0x597f299cfc657e2aULL, 0x5fcb6fab3ad6faecULL, 0x6c44198c4a475817ULL,
+};
+static const uint64_t solver_sha512_iv[8] = {
+	0x6a09e667f3bcc908ULL, 0xbb67ae8584caa73bULL, 0x3c6ef372fe94f82bULL, 0xa54ff53a5f1d36f1ULL,
+	0x510e527fade682d1ULL, 0x9b05688c2b3e6c1fULL, 0x1f83d9abfb41bd6bULL, 0x5be0cd19137e2179ULL,
+};
+#define SHA_ROTR(x, s) _mm256_or_si256(_mm256_srli_epi64((x), (s)), _mm256_slli_epi64((x), 64 - (s)))
+
+// dig = 4 digest berurutan (4 x 64 byte); tiap lane: dig = SHA512(dig), diulang iters kali
+__attribute__((target("avx2")))
+static void solver_sha512_chain_x4(uint8_t *dig, int iters) {
+	__m256i h[8], w[16], iv[8];
+	for (int j = 0; j < 8; j++) {
+		uint64_t v[4];
+		for (int l = 0; l < 4; l++) { memcpy(&v[l], dig + 64*l + 8*j, 8); v[l] = __builtin_bswap64(v[l]); }
+		h[j] = _mm256_setr_epi64x((long long)v[0], (long long)v[1], (long long)v[2], (long long)v[3]);
+		iv[j] = _mm256_set1_epi64x((long long)solver_sha512_iv[j]);
+	}
+	for (int it = 0; it < iters; it++) {
+		for (int j = 0; j < 8; j++) w[j] = h[j];
+		w[8] = _mm256_set1_epi64x((long long)0x8000000000000000ULL);
+		for (int j = 9; j < 15; j++) w[j] = _mm256_setzero_si256();
+		w[15] = _mm256_set1_epi64x(512);
+		__m256i a = iv[0], b = iv[1], c = iv[2], d = iv[3], e = iv[4], f = iv[5], g = iv[6], hh = iv[7];
+		for (int t = 0; t < 80; t++) {
+			__m256i wt;
+			if (t < 16) wt = w[t];
+			else {
+				__m256i w15 = w[(t - 15) & 15], w2 = w[(t - 2) & 15];
+				__m256i s0 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(w15, 1), SHA_ROTR(w15, 8)), _mm256_srli_epi64(w15, 7));
+				__m256i s1 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(w2, 19), SHA_ROTR(w2, 61)), _mm256_srli_epi64(w2, 6));
+				wt = w[t & 15] = _mm256_add_epi64(_mm256_add_epi64(w[t & 15], s0), _mm256_add_epi64(w[(t - 7) & 15], s1));
+			}
+			__m256i S1 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(e, 14), SHA_ROTR(e, 18)), SHA_ROTR(e, 41));
+			__m256i ch = _mm256_xor_si256(g, _mm256_and_si256(e, _mm256_xor_si256(f, g)));
+			__m256i t1 = _mm256_add_epi64(_mm256_add_epi64(hh, S1), _mm256_add_epi64(ch, _mm256_add_epi64(wt, _mm256_set1_epi64x((long long)solver_sha512_k[t]))));
+			__m256i S0 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(a, 28), SHA_ROTR(a, 34)), SHA_ROTR(a, 39));
+			__m256i maj = _mm256_or_si256(_mm256_and_si256(a, b), _mm256_and_si256(c, _mm256_or_si256(a, b)));
+			hh = g; g = f; f = e; e = _mm256_add_epi64(d, t1);
+			d = c; c = b; b = a; a = _mm256_add_epi64(t1, _mm256_add_epi64(S0, maj));
+		}
+		h[0] = _mm256_add_epi64(a, iv[0]); h[1] = _mm256_add_epi64(b, iv[1]);
+		h[2] = _mm256_add_epi64(c, iv[2]); h[3] = _mm256_add_epi64(d, iv[3]);
+		h[4] = _mm256_add_epi64(e, iv[4]); h[5] = _mm256_add_epi64(f, iv[5]);
+		h[6] = _mm256_add_epi64(g, iv[6]); h[7] = _mm256_add_epi64(hh, iv[7]);
+	}
+	for (int j = 0; j < 8; j++) {
+		uint64_t v[4];
+		_mm256_storeu_si256((__m256i *)v, h[j]);
+		for (int l = 0; l < 4; l++) { v[l] = __builtin_bswap64(v[l]); memcpy(dig + 64*l + 8*j, &v[l], 8); }
+	}
+}
+#else
+static void solver_sha512_chain_x4(uint8_t *dig, int iters) {}
+#endif
+*/
 import "C"
 import (
 	"bytes"
 	"crypto/md5"
 	"crypto/sha512"
+	"encoding/binary"
 	"encoding/hex"
 	"fmt"
 	"unsafe"
@@ -67,18 +323,56 @@ func multiply(x, y byte) byte {
 	return (((y & 1) * x) ^ ((y>>1)&1)*xtime(x) ^ ((y>>2)&1)*xtime(xtime(x)) ^ ((y>>3)&1)*xtime(xtime(xtime(x))) ^ ((y>>4)&1)*xtime(xtime(xtime(xtime(x)))))
 }
 
+// Deteksi CPU cukup 1x saat library di-load, bukan per password.
+// aesForced = konstanta (build -tags aesni): cabang software AES dibuang compiler.
+const aesForced = C.SOLVER_AESNI != 0
+var cpuAES = C.solver_cpu_has_aes() != 0
+var hwAES = aesForced || cpuAES
+var hwMD5x8 = C.solver_cpu_has_avx2() != 0
+
+func init() {
+	if aesForced && !cpuAES {
+		panic("solver_lib: dibuild dengan -tags aesni tapi CPU ini tidak punya AES-NI; build ulang tanpa -tags aesni")
+	}
+}
+
 type CustomAES struct {
 	rounds, nk int
 	roundKeys  []byte
+	decKeys    []byte // round key versi Equivalent Inverse Cipher (khusus jalur hardware)
+	w          []uint32 // word key schedule sementara (dipakai ulang tiap setKey)
 }
 
 func NewCustomAES(key []byte, rounds int, nk int) *CustomAES {
-	c := &CustomAES{rounds: rounds, nk: nk}
-	c.keyExpansion(key); return c
+	c := &CustomAES{}
+	c.setKey(key, rounds, nk)
+	return c
+}
+
+// setKey: ganti key tanpa alokasi baru, buffer key schedule dipakai ulang
+// (1 CustomAES per pemanggil batch, bukan 1 per kandidat)
+func (c *CustomAES) setKey(key []byte, rounds int, nk int) {
+	c.rounds, c.nk = rounds, nk
+	c.keyExpansion(key)
+	if aesForced || hwAES {
+		if cap(c.decKeys) < len(c.roundKeys) { c.decKeys = make([]byte, len(c.roundKeys)) }
+		c.decKeys = c.decKeys[:len(c.roundKeys)]
+		C.solver_aes_prepare_dec((*C.uint8_t)(unsafe.Pointer(&c.roundKeys[0])), C.int(rounds), (*C.uint8_t)(unsafe.Pointer(&c.decKeys[0])))
+	}
+}
+
+// DecryptCBCHardware: dekripsi CBC n block sekaligus via AES-NI / ARMv8 CE.
+// Hanya valid untuk mode ColMajor + ShiftRight (= urutan byte AES standar).
+func (c *CustomAES) DecryptCBCHardware(iv, in, out []byte) {
+	C.solver_aes_dec_cbc((*C.uint8_t)(unsafe.Pointer(&c.decKeys[0])), C.int(c.rounds),
+		(*C.uint8_t)(unsafe.Pointer(&iv[0])), (*C.uint8_t)(unsafe.Pointer(&in[0])),
+		(*C.uint8_t)(unsafe.Pointer(&out[0])), C.int(len(in)/16))
 }
 
 func (c *CustomAES) keyExpansion(key []byte) {
-	nb := 4; ksWords := nb * (c.rounds + 1); w := make([]uint32, ksWords)
+	nb := 4; ksWords := nb * (c.rounds + 1)
+	if cap(c.w) < ksWords { c.w = make([]uint32, ksWords) }
+	w := c.w[:ksWords]
 	for i := 0; i < c.nk; i++ { w[i] = (uint32(key[4*i]) << 24) | (uint32(key[4*i+1]) << 16) | (uint32(key[4*i+2]) << 8) | uint32(key[4*i+3]) }
 	for i := c.nk; i < ksWords; i++ {
 		temp := w[i-1]
@@ -93,7 +387,8 @@ func (c *CustomAES) keyExpansion(key []byte) {
 		}
 		w[i] = w[i-c.nk] ^ temp
 	}
-	c.roundKeys = make([]byte, ksWords*4)
+	if cap(c.roundKeys) < ksWords*4 { c.roundKeys = make([]byte, ksWords*4) }
+	c.roundKeys = c.roundKeys[:ksWords*4]
 	for i := 0; i < ksWords; i++ {
 		c.roundKeys[4*i] = byte((w[i]>>24)&0xff); c.roundKeys[4*i+1] = byte((w[i]>>16)&0xff); c.roundKeys[4*i+2] = byte((w[i]>>8)&0xff); c.roundKeys[4*i+3] = byte(w[i]&0xff)
 	}
@@ -170,88 +465,385 @@ func (c *CustomAES) invMixColumns(state *[4][4]byte) {
 // =============================================================================
 // 3. HYBRID LOGIC DERIVATION (RAW -> HEX -> KDF) - WINNING LOGIC!
 // =============================================================================
-func derive(password string, salt []byte) ([]byte, []byte) {
+// sha512Hex: langkah 1 + 2 derive (SHA-512 chain lalu hex), dipakai derive & deriveBatch
+func sha512Hex(password []byte) (hexBuf [sha512.Size * 2]byte) {
 	// 1. SHA-512 Loop (Output RAW BYTES)
-	// Kita pertahankan dalam bentuk bytes selama iterasi
-	curr := []byte(password)
-	for i := 0; i < 11513; i++ {
-		sum := sha512.Sum512(curr)
-		curr = sum[:] 
-	}
+	// Kita pertahankan dalam bentuk bytes selama iterasi. Digest ditimpa di array
+	// tetap (sum[:] tidak lagi kabur ke heap tiap iterasi)
+	sum := sha512.Sum512(password)
+	for i := 1; i < 11513; i++ { sum = sha512.Sum512(sum[:]) }
 	
 	// 2. BRIDGE: Convert Final Raw Bytes -> HEX STRING
 	// Ini adalah kunci kemenangan! KDF tidak menerima raw bytes, tapi hex string dari raw bytes.
-	hexString := hex.EncodeToString(curr)
+	hex.Encode(hexBuf[:], sum[:])
+	return hexBuf
+}
+
+func derive(password []byte, salt []byte, sc *checkScratch) ([]byte, []byte) {
+	hexBuf := sha512Hex(password)
 	
 	// 3. KDF: Menggunakan Input HEX STRING
 	keyLen, ivLen := 128, 16
 	total := keyLen + ivLen
-	generated := make([]byte, 0, total+16)
-	prevMD5 := []byte{}
+	generated := sc.gen[0][:0] // output KDF ditulis ke scratch, bukan slice baru
 	
-	inputData := []byte(hexString) // Input ke KDF adalah bytes dari string hex
+	inputData := hexBuf[:] // Input ke KDF adalah bytes dari string hex
 	
+	// Tiap blok: MD5(prev || hex || salt) lalu 9999x MD5 atas 16 byte. Chain jalan di
+	// array [16]byte tetap via md5.Sum (tanpa md5.New + Sum(nil) = 2 alokasi per iterasi)
+	blockIn := sc.blockIn[:0]
+	var m [md5.Size]byte
 	for len(generated) < total {
-		h := md5.New()
-		if len(prevMD5) > 0 { h.Write(prevMD5) }
-		h.Write(inputData)
-		h.Write(salt)
-		m := h.Sum(nil)
-		for i := 1; i < 10000; i++ { h2 := md5.New(); h2.Write(m); m = h2.Sum(nil) }
-		generated = append(generated, m...); prevMD5 = m
+		blockIn = blockIn[:0]
+		if len(generated) > 0 { blockIn = append(blockIn, m[:]...) }
+		blockIn = append(append(blockIn, inputData...), salt...)
+		m = md5.Sum(blockIn)
+		for i := 1; i < 10000; i++ { m = md5.Sum(m[:]) }
+		generated = append(generated, m[:]...)
 	}
+	sc.blockIn = blockIn
 	return generated[:keyLen], generated[keyLen : keyLen+ivLen]
 }
 
+// sha512HexBatch: sha512Hex untuk s/d 8 password. SHA-512 pertama (panjang password
+// bervariasi) per password, 11512 iterasi sisanya 4 lane sekaligus (solver_sha512_chain_x4).
+func sha512HexBatch(passwords [][]byte) (hexs [8][sha512.Size * 2]byte) {
+	n := len(passwords)
+	var sums [8 * sha512.Size]byte // lane >= n dibiarkan 0 (ikut dihitung, hasil dibuang)
+	for l, pw := range passwords { s := sha512.Sum512(pw); copy(sums[l*sha512.Size:], s[:]) }
+	for l := 0; l < n; l += 4 { C.solver_sha512_chain_x4((*C.uint8_t)(unsafe.Pointer(&sums[l*sha512.Size])), 11512) }
+	for l := 0; l < n; l++ { hex.Encode(hexs[l][:], sums[l*sha512.Size:(l+1)*sha512.Size]) }
+	return
+}
+
+// deriveBatch: derive untuk s/d 8 password sekaligus (hasil identik dengan derive).
+// SHA-512 chain + hex lewat sha512HexBatch; MD5 pertama tiap blok tetap per password,
+// 9999 iterasi MD5 sisanya 8 lane paralel (solver_md5_chain_x8).
+func deriveBatch(passwords [][]byte, salt []byte, sc *checkScratch) {
+	keyLen, ivLen := 128, 16
+	n := len(passwords)
+	hexs := sha512HexBatch(passwords)
+
+	var gen [8][]byte
+	for l := 0; l < n; l++ { gen[l] = sc.gen[l][:0] }
+	blockIn := sc.blockIn[:0]
+	var dig [8 * md5.Size]byte // lane >= n dibiarkan (ikut dihitung, hasil dibuang)
+	for len(gen[0]) < keyLen+ivLen {
+		for l := 0; l < n; l++ {
+			blockIn = blockIn[:0]
+			if len(gen[l]) > 0 { blockIn = append(blockIn, gen[l][len(gen[l])-md5.Size:]...) }
+			blockIn = append(append(blockIn, hexs[l][:]...), salt...)
+			m := md5.Sum(blockIn)
+			copy(dig[l*md5.Size:], m[:])
+		}
+		C.solver_md5_chain_x8((*C.uint8_t)(unsafe.Pointer(&dig[0])), 9999)
+		for l := 0; l < n; l++ { gen[l] = append(gen[l], dig[l*md5.Size:(l+1)*md5.Size]...) }
+	}
+	sc.blockIn = blockIn
+}
+
+// checkScratch: buffer kerja 1 pemanggil (CheckPasswordBatch / CheckPermutationBlock),
+// dipakai ulang semua kandidat: key schedule AES, output KDF (key || IV per lane), input
+// blok MD5 & plaintext header tidak dialokasikan lagi per password
+type checkScratch struct {
+	aes     CustomAES
+	gen     [8][128 + 16]byte
+	blockIn []byte
+	ring    [96]byte
+}
+
+func newCheckScratch() *checkScratch {
+	return &checkScratch{blockIn: make([]byte, 0, md5.Size+sha512.Size*2+8)}
+}
+
 // =============================================================================
 // 4. MAIN CHECK FUNCTION (MULTI-PATTERN)
 // =============================================================================
 //export CheckPassword
 func CheckPassword(passC *C.char, saltC *C.uchar, cipherC *C.uchar, cipherLen C.int) C.int {
-	password := C.GoString(passC)
+	password := []byte(C.GoString(passC))
 	salt := C.GoBytes(unsafe.Pointer(saltC), 8)
 	ciphertext := C.GoBytes(unsafe.Pointer(cipherC), C.int(cipherLen))
 
+	if checkCore(password, salt, ciphertext, newCheckScratch()) { return 1 }
+	return 0
+}
+
+// checkCore: inti pengecekan 1 password (dipakai CheckPassword & checkLanes)
+func checkCore(password []byte, salt []byte, ciphertext []byte, sc *checkScratch) bool {
 	// Step 1: Derive Key/IV (Logic Hybrid)
-	key, iv := derive(password, salt)
-	
-	// Step 2: AES Setup
-	aes := NewCustomAES(key, 38, 32)
+	key, iv := derive(password, salt, sc)
+	return checkKey(password, key, iv, ciphertext, sc)
+}
+
+// checkLanes: cek s/d 8 password, return index yang match / -1. Dengan AVX2,
+// chain SHA-512 & MD5 ke-8 password dihitung paralel (deriveBatch), selain itu satu per satu.
+func checkLanes(passwords [][]byte, salt []byte, ciphertext []byte, sc *checkScratch) int {
+	if hwMD5x8 {
+		deriveBatch(passwords, salt, sc)
+		for i, pw := range passwords { if checkKey(pw, sc.gen[i][:128], sc.gen[i][128:], ciphertext, sc) { return i } }
+		return -1
+	}
+	for i, pw := range passwords { if checkCore(pw, salt, ciphertext, sc) { return i } }
+	return -1
+}
+
+// checkKey: Step 2-4 (AES + deteksi pola) untuk key/iv yang sudah diturunkan
+func checkKey(password, key, iv, ciphertext []byte, sc *checkScratch) bool {
+	// Step 2: AES Setup (key schedule ditulis ulang di scratch)
+	aes := &sc.aes
+	aes.setKey(key, 38, 32)
 	
 	// Step 3: Decrypt Header Only (Optimization)
 	limit := len(ciphertext)
 	if limit > 96 { limit = 96 } // Cek 96 bytes awal cukup untuk header
 	limit -= limit % 16
 	
-	ringBuf := make([]byte, 0, 128)
-	currentIV := make([]byte, 16); copy(currentIV, iv)
+	ringBuf := sc.ring[:0]
 	
-	for i := 0; i < limit; i += 16 {
-		block := ciphertext[i : i+16]
-		nextIV := make([]byte, 16); copy(nextIV, block)
-		
-		// HYBRID AES MODE: ColMajor (False), ShiftRight (True)
-		// Ini adalah konfigurasi yang VALID untuk file ini.
-		decBlock := aes.InvCipherBlock(block, false, true) 
-		
-		for j := 0; j < 16; j++ { decBlock[j] ^= currentIV[j] }
-		currentIV = nextIV
-		ringBuf = append(ringBuf, decBlock...)
+	// Blok pertama didekripsi dulu: jika headerPrefilter nyala, key salah (~86% kandidat)
+	// langsung ditolak dari 16 byte pertama sebelum sisa header didekripsi
+	if (aesForced || hwAES) && limit > 0 {
+		// HARDWARE PATH: blok 0, lalu sisa block header dalam 1x panggilan C
+		ringBuf = ringBuf[:16]
+		aes.DecryptCBCHardware(iv, ciphertext[:16], ringBuf)
+		if headerPrefilter && !headerPlausible(ringBuf) { return false }
+		ringBuf = ringBuf[:limit]
+		if limit > 16 { aes.DecryptCBCHardware(ciphertext[:16], ciphertext[16:limit], ringBuf[16:]) }
+	} else {
+		currentIV := make([]byte, 16); copy(currentIV, iv)
+		for i := 0; i < limit; i += 16 {
+			block := ciphertext[i : i+16]
+			nextIV := make([]byte, 16); copy(nextIV, block)
+			
+			// HYBRID AES MODE: ColMajor (False), ShiftRight (True)
+			// Ini adalah konfigurasi yang VALID untuk file ini.
+			decBlock := aes.InvCipherBlock(block, false, true) 
+			
+			for j := 0; j < 16; j++ { decBlock[j] ^= currentIV[j] }
+			currentIV = nextIV
+			ringBuf = append(ringBuf, decBlock...)
+			if i == 0 && headerPrefilter && !headerPlausible(ringBuf) { return false }
+		}
 	}
 
 	// Step 4: Multi-Pattern Detection
 	// Mendeteksi berbagai jenis format output
 	// RSA Pattern (Arweave) OR Wallet Pattern (Ethereum/V3)
-	if bytes.Contains(ringBuf, []byte("\"id\":")) || 
-	   bytes.Contains(ringBuf, []byte("\"version\":3")) ||
-	   bytes.Contains(ringBuf, []byte("\"kty\"")) { 
+	if hasHeaderPattern(ringBuf) { 
 		
 		// PRINT HASIL MATCH (Ini sekarang sudah di-uncomment dan aman)
 		fmt.Printf("\n[GO MATCH] PW: %s | Dec: %s\n", password, string(ringBuf))
-		return 1
+		return true
+	}
+
+	return false
+}
+
+// headerPrefilter: tolak key dari blok pertama saja (headerPlausible) sebelum scan pola.
+// Default MATI: plaintext yang diawali byte biner/kontrol akan miss (false negative), padahal
+// hematnya cuma <= 5 blok AES per kandidat (KDF jauh lebih mahal). Nyalakan hanya lewat
+// SetHeaderPrefilter(1) jika format target pasti teks sejak byte 0.
+var headerPrefilter = false
+
+// notText[b] = 1 hanya untuk byte yang pasti bukan teks: kontrol selain \t \r \n, dan DEL.
+// Byte >= 0x80 lolos (BOM & teks UTF-8 non-ASCII sebelum pola tetap lolos)
+var notText = func() (t [256]byte) {
+	for i := range t {
+		if (i < 0x20 && i != '\t' && i != '\n' && i != '\r') || i == 0x7f { t[i] = 1 }
 	}
+	return
+}()
 
+// headerPlausible: blok pertama plaintext asli = teks (JSON, boleh BOM / UTF-8 non-ASCII).
+// Key salah = 16 byte acak, lolos ~(226/256)^16 ≈ 14% kandidat. Semua byte dicek
+// (OR-accumulate, tanpa early-exit) seperti hasHeaderPattern.
+func headerPlausible(b []byte) bool {
+	var bad byte
+	for _, c := range b { bad |= notText[c] }
+	return bad == 0
+}
+
+// Pola header sebagai 2 word 64-bit little-endian + mask (SWAR, pola <= 16 byte)
+type headerPattern struct{ lo, loMask, hi, hiMask uint64 }
+
+func newHeaderPattern(p string) (hp headerPattern) {
+	var b, m [16]byte
+	copy(b[:], p)
+	for i := range p { m[i] = 0xff }
+	return headerPattern{binary.LittleEndian.Uint64(b[:]), binary.LittleEndian.Uint64(m[:]),
+		binary.LittleEndian.Uint64(b[8:]), binary.LittleEndian.Uint64(m[8:])}
+}
+
+var headerPatterns = [...]headerPattern{newHeaderPattern("\"id\":"), newHeaderPattern("\"version\":3"), newHeaderPattern("\"kty\"")}
+
+// hasHeaderPattern: pengganti 3x bytes.Contains. Semua offset & semua pola dicek dengan
+// XOR-OR accumulator tanpa early-exit, jadi kerja per kandidat konstan & tanpa branch
+// per byte (hampir semua kandidat miss, branch data acak = mispredict). Byte di luar buf
+// dianggap 0 dan tidak pernah cocok karena semua byte pola bukan 0.
+func hasHeaderPattern(buf []byte) bool {
+	var pad [96 + 16]byte
+	n := copy(pad[:96], buf)
+	var hit uint64
+	for i := 0; i < n; i++ {
+		lo, hi := binary.LittleEndian.Uint64(pad[i:]), binary.LittleEndian.Uint64(pad[i+8:])
+		for _, p := range headerPatterns {
+			d := ((lo ^ p.lo) & p.loMask) | ((hi ^ p.hi) & p.hiMask)
+			hit |= ((d | -d) >> 63) ^ 1 // 1 jika d == 0
+		}
+	}
+	return hit != 0
+}
+
+//export HasAESNI
+func HasAESNI() C.int {
+	if hwAES { return 1 }
 	return 0
 }
 
+//export SetHeaderPrefilter
+func SetHeaderPrefilter(on C.int) { headerPrefilter = on != 0 }
+
+// =============================================================================
+// 5. BLOCK CHECK (PERMUTASI DI SISI GO)
+// =============================================================================
+// CheckPermutationBlock mengerjakan 1 blok penuh: semua urutan UNIK kata sisa di
+// belakang prefix tetap (kata kembar tidak menghasilkan urutan dobel). Python
+// cukup 1x panggil per blok, tidak ada lagi encode + ctypes marshaling per password.
+// Return: 1 = match (urutan index ditulis ke outMatchIdx), 0 = habis, -1 = argumen invalid.
+//export CheckPermutationBlock
+func CheckPermutationBlock(wordsC **C.char, nWords C.int, r C.int, prefixC *C.int, prefixLen C.int, saltC *C.uchar, cipherC *C.uchar, cipherLen C.int, outMatchIdx *C.int, outChecked *C.longlong) C.int {
+	n, p := int(nWords), int(prefixLen)
+	*outChecked = 0
+	// Hanya permutasi penuh (r == n)
+	if int(r) != n || p < 0 || p > n { return -1 }
+
+	words := make([][]byte, n)
+	for i, w := range unsafe.Slice(wordsC, n) { words[i] = []byte(C.GoString(w)) }
+	prefix := make([]int, p)
+	for i, idx := range unsafe.Slice(prefixC, p) { prefix[i] = int(idx) }
+	salt := C.GoBytes(unsafe.Pointer(saltC), 8)
+	ciphertext := C.GoBytes(unsafe.Pointer(cipherC), C.int(cipherLen))
+
+	match := make([]int, n)
+	ret, checked := checkPermutationBlock(words, prefix, salt, ciphertext, match)
+	*outChecked = C.longlong(checked)
+	if ret == 1 {
+		out := unsafe.Slice(outMatchIdx, n)
+		for i, idx := range match { out[i] = C.int(idx) }
+	}
+	return C.int(ret)
+}
+
+// checkPermutationBlock: inti CheckPermutationBlock dengan tipe Go (bisa dites tanpa cgo).
+// outMatch (len(words)) diisi urutan index kata yang match. Return (1/0/-1, jumlah dicek).
+func checkPermutationBlock(words [][]byte, prefix []int, salt, ciphertext []byte, outMatch []int) (int, int64) {
+	n, p := len(words), len(prefix)
+	if p > n { return -1, 0 }
+
+	// Kelas kata: kata kembar dapat id yang sama (index kemunculan pertama)
+	cls := make([]int, n)
+	for i := range words {
+		cls[i] = i
+		for j := 0; j < i; j++ { if bytes.Equal(words[i], words[j]) { cls[i] = cls[j]; break } }
+	}
+
+	// Susun slot: prefix tetap di depan, sisa kata (urut kelas) di belakang
+	perm := make([]int, 0, n)
+	used := make([]bool, n)
+	for _, idx := range prefix {
+		if idx < 0 || idx >= n || used[idx] { return -1, 0 }
+		used[idx] = true; perm = append(perm, idx)
+	}
+	for i := 0; i < n; i++ { if !used[i] { perm = append(perm, i) } }
+	for i := p + 1; i < n; i++ {
+		for j := i; j > p && cls[perm[j-1]] > cls[perm[j]]; j-- { perm[j-1], perm[j] = perm[j], perm[j-1] }
+	}
+
+	// Scratch buffer dipakai ulang selama 1 blok; offs[i] = posisi byte slot i
+	buf := make([]byte, 0, 256)
+	offs := make([]int, n+1)
+	for i, idx := range perm { offs[i] = len(buf); buf = append(buf, words[idx]...) }
+	offs[n] = len(buf)
+
+	// rewrite: tulis ulang hanya rentang slot lo..hi (panjang total tidak berubah)
+	rewrite := func(lo, hi int) {
+		pos := offs[lo]
+		for i := lo; i <= hi; i++ { offs[i] = pos; pos += copy(buf[pos:], words[perm[i]]) }
+	}
+
+	// Kandidat ditampung per 8 (lane MD5 AVX2) lalu dicek bareng lewat checkLanes
+	sc := newCheckScratch()
+	var checked int64
+	var lanePw [8][]byte
+	var lanePerm [8][]int
+	for l := range lanePw { lanePw[l] = make([]byte, len(buf)); lanePerm[l] = make([]int, n) }
+	nl := 0
+	flush := func() bool {
+		hit := checkLanes(lanePw[:nl], salt, ciphertext, sc)
+		nl = 0
+		if hit < 0 { return false }
+		copy(outMatch, lanePerm[hit])
+		return true
+	}
+	check := func() bool {
+		checked++
+		copy(lanePw[nl], buf); copy(lanePerm[nl], perm)
+		nl++
+		return nl == len(lanePw) && flush()
+	}
+
+	// NARAYANA PANDITA (next permutation) atas slot p..n-1 dengan kunci kelas kata:
+	// urutan yang cuma menukar kata kembar otomatis dilewati. Rata-rata suffix
+	// yang berubah (dan ditulis ulang) tetap pendek.
+	found := check()
+	for !found {
+		i := n - 2
+		for i >= p && cls[perm[i]] >= cls[perm[i+1]] { i-- }
+		if i < p { break }
+		j := n - 1
+		for cls[perm[j]] <= cls[perm[i]] { j-- }
+		perm[i], perm[j] = perm[j], perm[i]
+		for a, b := i+1, n-1; a < b; a, b = a+1, b-1 { perm[a], perm[b] = perm[b], perm[a] }
+		rewrite(i, n-1)
+		found = check()
+	}
+	if !found && nl > 0 { found = flush() }
+
+	if found { return 1, checked }
+	return 0, checked
+}
+
+// =============================================================================
+// 6. BATCH CHECK (VECTOR API)
+// =============================================================================
+// CheckPasswordBatch mengecek n password dalam 1x panggilan ctypes (overhead
+// marshaling + GIL dibagi n). Password ke-i = pwBuf[offsets[i]:offsets[i+1]],
+// jadi offsets berisi n+1 entri. Return: index password yang match, -1 = tidak ada.
+//export CheckPasswordBatch
+func CheckPasswordBatch(pwBuf *C.uchar, offsets *C.uint, n C.int, saltC *C.uchar, cipherC *C.uchar, cipherLen C.int) C.int {
+	if n <= 0 { return -1 }
+	offs := unsafe.Slice((*uint32)(unsafe.Pointer(offsets)), int(n)+1)
+	buf := unsafe.Slice((*byte)(unsafe.Pointer(pwBuf)), int(offs[n]))
+	salt := C.GoBytes(unsafe.Pointer(saltC), 8)
+	ciphertext := C.GoBytes(unsafe.Pointer(cipherC), C.int(cipherLen))
+	return C.int(checkPasswordBatch(buf, offs, salt, ciphertext))
+}
+
+// checkPasswordBatch: inti CheckPasswordBatch dengan tipe Go (bisa dites tanpa cgo),
+// offs berisi len(password)+1 entri
+func checkPasswordBatch(buf []byte, offs []uint32, salt, ciphertext []byte) int {
+	n := len(offs) - 1
+	// Dicek per 8 password (= jumlah lane MD5 AVX2)
+	var lanes [8][]byte
+	sc := newCheckScratch()
+	for lo := 0; lo < n; lo += 8 {
+		hi := lo + 8
+		if hi > n { hi = n }
+		for i := lo; i < hi; i++ { lanes[i-lo] = buf[offs[i]:offs[i+1]] }
+		if hit := checkLanes(lanes[:hi-lo], salt, ciphertext, sc); hit >= 0 { return lo + hit }
+	}
+	return -1
+}
+
 func main() {}
@@ -0,0 +1,274 @@
+package main
+
+// Test prefilter blok pertama (headerPlausible) vs scan pola header 96 byte.
+// Jalankan: go test crypto_engine_universal_test.go crypto_engine_universal.go
+
+import (
+	"bytes"
+	"encoding/hex"
+	"fmt"
+	"sort"
+	"testing"
+)
+
+// Vektor: AES custom 38 round (nk=32) CBC, key[i] = i*7+3, iv[i] = i,
+// plaintext 96 byte (dipad spasi)
+var prefilterCases = []struct {
+	name, ct           string
+	withFilter, noFilt bool // hasil checkKey dengan / tanpa prefilter
+}{
+	// {"address":"008aee...","crypto":{"cipher":"aes-128-ctr"},"version":3} (92 byte)
+	{"keystore", "9ff20abf31c520cc57c0fc62e6e6f60ad667851c1035882452d48c73617113a86a233dbd66626168b5a5da63c324ead3e4ec7d608522e3b4e0e3b20fd54942e1eff1f426d52bf5d93ea49d68eccb8f067fe261dd56ec57e32da81b6e9ea2019e", true, true},
+	// BOM UTF-8 + {"kty":"RSA","n":"..."}
+	{"bom", "b572998e5aef29f38f7f40589073e81c7d4607979e857666c4fb3d5b3e2013656d74d4a3240211095f4cbb76a8236cd70101567c49d7db2837a072fe5aa14ca8f0c27c6c7d96561764975079cf1573ce544b067c96026f1029e955a7af07e1ed", true, true},
+	// teks UTF-8 non-ASCII sebelum pola: {"név":"Ñandú Åsa","id":7,...}
+	{"utf8", "00cd2887cad294e5ff65e94e07e5c1fd944dd4149a79cbcc7fda9ac8ed85aef1ec0e31a9b4c9455fcb20f7da48c588bdaa54a92c2a23731c67f25e96087739645d8cb25137b7f70d37bbbe7d585a9a45ecfd7fec2c869e13a897e580900034c6", true, true},
+	// prefix biner (byte kontrol) sebelum {"kty":...}: lolos dengan default (prefilter mati),
+	// ditolak hanya jika prefilter dinyalakan (HEADER_PREFILTER = True)
+	{"binary", "8e44645df502b48e04b3a8d0ab6cd6e63c2bbfd5ef7c216397d0bb847123feb2a4f2e2583aebf873964f0a06028d241b9ff5b828b218bf408c3ef0f0bf06cd3f3dca7b1baf6c5d524a864fe2f6896f732014c72168d327801c550a3a30b7dd59", false, true},
+	// JSON tanpa pola header
+	{"miss", "318fe531006c9556bc30b620c06388246ffe08d1ac27062082654e775f079c1010a266ada98367fe6ed85105b35024dc0fd92bd0a0ce32f0b6e33c006c34173bca20c03c26455900feb0ffd4fa5b2d83338fd9329098e5dc68298fee13c84abf", false, false},
+}
+
+func TestHeaderPrefilter(t *testing.T) {
+	key, iv := make([]byte, 128), make([]byte, 16)
+	for i := range key { key[i] = byte(i*7 + 3) }
+	for i := range iv { iv[i] = byte(i) }
+	defer func(hw, pf bool) { hwAES, headerPrefilter = hw, pf }(hwAES, headerPrefilter)
+
+	// Dua jalur dekripsi (software & AES-NI/CE) sama-sama memakai prefilter
+	hwAvail := hwAES
+	sc := newCheckScratch()
+	for _, hw := range []bool{false, true} {
+		if (hw && !hwAvail) || (!hw && aesForced) { continue }
+		hwAES = hw
+		t.Logf("jalur AES hardware=%v", hw)
+		for _, tc := range prefilterCases {
+			ct, _ := hex.DecodeString(tc.ct)
+			for _, pf := range []bool{true, false} {
+				headerPrefilter = pf
+				want := tc.noFilt
+				if pf { want = tc.withFilter }
+				if got := checkKey([]byte(tc.name), key, iv, ct, sc); got != want {
+					t.Errorf("%s (hwAES=%v, prefilter=%v): checkKey = %v, want %v", tc.name, hw, pf, got, want)
+				}
+			}
+		}
+	}
+}
+
+// Default build: prefilter mati, header diawali byte biner tetap ketemu (tanpa false negative)
+func TestHeaderPrefilterDefaultOff(t *testing.T) {
+	if headerPrefilter { t.Fatal("headerPrefilter harus default false") }
+	key, iv := make([]byte, 128), make([]byte, 16)
+	for i := range key { key[i] = byte(i*7 + 3) }
+	for i := range iv { iv[i] = byte(i) }
+	for _, tc := range prefilterCases {
+		ct, _ := hex.DecodeString(tc.ct)
+		if got := checkKey([]byte(tc.name), key, iv, ct, newCheckScratch()); got != tc.noFilt {
+			t.Errorf("%s: checkKey default = %v, want %v", tc.name, got, tc.noFilt)
+		}
+	}
+}
+
+// Key salah = plaintext acak: prefilter hanya boleh menolak, scan pola tanpa prefilter tetap miss
+func TestHeaderPrefilterWrongKey(t *testing.T) {
+	key, iv := make([]byte, 128), make([]byte, 16)
+	for i := range key { key[i] = byte(i*7 + 4) }
+	defer func(pf bool) { headerPrefilter = pf }(headerPrefilter)
+	sc := newCheckScratch()
+	for _, tc := range prefilterCases {
+		ct, _ := hex.DecodeString(tc.ct)
+		for _, pf := range []bool{true, false} {
+			headerPrefilter = pf
+			if checkKey([]byte(tc.name), key, iv, ct, sc) { t.Errorf("%s: key salah lolos (prefilter=%v)", tc.name, pf) }
+		}
+	}
+}
+
+// kdfTestPasswords: n password dengan panjang bervariasi (0 byte s/d > 1 blok SHA-512)
+func kdfTestPasswords(n int) [][]byte {
+	pws := make([][]byte, n)
+	for i := range pws {
+		pws[i] = make([]byte, (i*37)%150)
+		for j := range pws[i] { pws[i][j] = byte('a' + (i+j)%26) }
+	}
+	return pws
+}
+
+// sha512HexBatch (chain SHA-512 AVX2 4 lane) vs sha512Hex skalar: batch 1..9 menutup
+// grup 4 lane penuh, grup parsial & ekor > 8 (dipecah per 8)
+func TestSha512HexBatchMatchesScalar(t *testing.T) {
+	if !hwMD5x8 { t.Skip("CPU tanpa AVX2: sha512HexBatch tidak dipakai") }
+	for n := 1; n <= 9; n++ {
+		pws := kdfTestPasswords(n)
+		for lo := 0; lo < n; lo += 8 {
+			hi := lo + 8
+			if hi > n { hi = n }
+			got := sha512HexBatch(pws[lo:hi])
+			for l := 0; l < hi-lo; l++ {
+				if want := sha512Hex(pws[lo+l]); got[l] != want {
+					t.Errorf("n=%d password #%d (len %d): sha512HexBatch != sha512Hex", n, lo+l, len(pws[lo+l]))
+				}
+			}
+		}
+	}
+}
+
+// deriveBatch (chain AVX2 8 lane MD5 + 4 lane SHA-512) vs derive skalar. Ukuran batch
+// ganjil / > 8 dipecah per 8 seperti checkLanes dipanggil CheckPasswordBatch: lane kosong
+// & ekor batch ikut teruji.
+func TestDeriveBatchMatchesDerive(t *testing.T) {
+	if !hwMD5x8 { t.Skip("CPU tanpa AVX2: deriveBatch tidak dipakai") }
+	salt := []byte{1, 2, 3, 4, 5, 6, 7, 8}
+	ref, sc := newCheckScratch(), newCheckScratch()
+	for _, n := range []int{1, 3, 4, 7, 8, 9} {
+		pws := kdfTestPasswords(n)
+		for lo := 0; lo < n; lo += 8 {
+			hi := lo + 8
+			if hi > n { hi = n }
+			deriveBatch(pws[lo:hi], salt, sc)
+			for l := 0; l < hi-lo; l++ {
+				key, iv := derive(pws[lo+l], salt, ref)
+				if !bytes.Equal(sc.gen[l][:128], key) || !bytes.Equal(sc.gen[l][128:], iv) {
+					t.Errorf("n=%d password #%d (len %d): deriveBatch != derive", n, lo+l, len(pws[lo+l]))
+				}
+			}
+		}
+	}
+}
+
+// Vektor KDF asli (ref): salt 1..8, plaintext header keystore v3 (92 byte + spasi s/d 96)
+var (
+	kdfTestSalt = []byte{1, 2, 3, 4, 5, 6, 7, 8}
+	// password "cedabab"
+	ctCedabab, _ = hex.DecodeString("9b62e444d1bb77cfb53b7a3151ac54bdf8e2286e8bf1aa78f1eb43e35b81bf361b78a76b65e6fb2e6058737182dfb2fed10bfaf8ded81e7a41037b11920a3dfb7ad4cc28e49b137e4dd51a26b2bbf6087f422bff4405d884d1bc3dc22ece26a9")
+)
+
+// bruteOrders: semua urutan UNIK (per isi kata, kata kembar = sama) kata sisa di belakang
+// prefix, urut leksikografis menurut kelas kata (index kemunculan pertama)
+func bruteOrders(words [][]byte, prefix []int) [][]int {
+	cls := make([]int, len(words))
+	for i := range words {
+		cls[i] = i
+		for j := 0; j < i; j++ { if bytes.Equal(words[i], words[j]) { cls[i] = cls[j]; break } }
+	}
+	used := make([]bool, len(words))
+	for _, i := range prefix { used[i] = true }
+	seen := map[string]bool{}
+	var out [][]int
+	var rec func(cur []int)
+	rec = func(cur []int) {
+		if len(cur) == len(words) {
+			key := fmt.Sprint(func() (c []int) { for _, i := range cur { c = append(c, cls[i]) }; return }())
+			if !seen[key] { seen[key] = true; out = append(out, append([]int(nil), cur...)) }
+			return
+		}
+		for i := range words {
+			if !used[i] { used[i] = true; rec(append(cur, i)); used[i] = false }
+		}
+	}
+	rec(append([]int(nil), prefix...))
+	sort.Slice(out, func(a, b int) bool {
+		for k := range out[a] { if cls[out[a][k]] != cls[out[b][k]] { return cls[out[a][k]] < cls[out[b][k]] } }
+		return false
+	})
+	return out
+}
+
+func joinWords(words [][]byte, order []int) (s []byte) {
+	for _, i := range order { s = append(s, words[i]...) }
+	return
+}
+
+// checkPermutationBlock (Narayana atas multiset kata) vs enumerasi brute force
+func TestCheckPermutationBlock(t *testing.T) {
+	words := [][]byte{[]byte("ab"), []byte("c"), []byte("ab"), []byte("d"), []byte("e")}
+	match := make([]int, len(words))
+
+	// Tanpa match: jumlah dicek = jumlah urutan unik (kata kembar tidak dicek dobel),
+	// termasuk prefix berupa kata kembar (index 2 = "ab" kedua)
+	for _, prefix := range [][]int{{0}, {2}, {3}, {4}, {0, 2}, {3, 0}} {
+		want := len(bruteOrders(words, prefix))
+		ret, checked := checkPermutationBlock(words, prefix, kdfTestSalt, ctCedabab, match)
+		if ret != 0 || checked != int64(want) {
+			t.Errorf("prefix %v: ret=%d checked=%d, want ret=0 checked=%d", prefix, ret, checked, want)
+		}
+	}
+
+	// Key tertanam di urutan TERAKHIR sub-blok prefix "c": sisa {ab,ab,d,e} -> "c"+"e"+"d"+"ab"+"ab"
+	orders := bruteOrders(words, []int{1})
+	if last := joinWords(words, orders[len(orders)-1]); string(last) != "cedabab" {
+		t.Fatalf("brute force: urutan terakhir = %q, want cedabab", last)
+	}
+	ret, checked := checkPermutationBlock(words, []int{1}, kdfTestSalt, ctCedabab, match)
+	if ret != 1 || checked != int64(len(orders)) {
+		t.Errorf("planted: ret=%d checked=%d, want ret=1 checked=%d", ret, checked, len(orders))
+	}
+	if got := joinWords(words, match); string(got) != "cedabab" {
+		t.Errorf("planted: outMatch %v = %q, want cedabab", match, got)
+	}
+
+	// Prefix invalid: index di luar range / dipakai 2x / lebih panjang dari kata
+	for _, prefix := range [][]int{{5}, {-1}, {0, 0}, {0, 1, 2, 3, 4, 0}} {
+		if ret, checked := checkPermutationBlock(words, prefix, kdfTestSalt, ctCedabab, match); ret != -1 || checked != 0 {
+			t.Errorf("prefix invalid %v: ret=%d checked=%d, want -1 0", prefix, ret, checked)
+		}
+	}
+}
+
+// password "pw-ke-9", salt kdfTestSalt
+var ctPwKe9, _ = hex.DecodeString("dd9addfbcb614bef28afb833fce1e79c4079e096fc8eb415206a09e17813d0a78821c095842ce3e6d74f6544e089353934c3c58f3b458c09ae66ff042cfd7b06b2c18b5334c3768fc750c81f93ed047881f00dc1d6cb99eb9d08af0d33e8d208")
+
+// packBatch: layout pwBuf + offsets (n+1 entri) seperti yang dikirim Python
+func packBatch(pws []string) (buf []byte, offs []uint32) {
+	offs = append(offs, 0)
+	for _, pw := range pws { buf = append(buf, pw...); offs = append(offs, uint32(len(buf))) }
+	return
+}
+
+// checkPasswordBatch dengan offset tidak rata (panjang password beda-beda, ada yg kosong),
+// 11 password = 1 grup penuh 8 + grup sisa 3
+func TestCheckPasswordBatch(t *testing.T) {
+	pws := []string{"a", "", "pw-ke-2xx", "pw3", "pw-ke-4-panjang-sekali", "p5", "pw-ke-6", "pw-ke-77", "x", "pw-ke-9", "pw-ke-10"}
+	buf, offs := packBatch(pws)
+	if got := checkPasswordBatch(buf, offs, kdfTestSalt, ctPwKe9); got != 9 {
+		t.Errorf("planted di index 9: got %d", got)
+	}
+	pws[9] = "pw-ke-9x"
+	buf, offs = packBatch(pws)
+	if got := checkPasswordBatch(buf, offs, kdfTestSalt, ctPwKe9); got != -1 {
+		t.Errorf("tanpa match: got %d, want -1", got)
+	}
+	// index 0 (grup pertama) dengan sisa grup kedua tidak penuh
+	buf, offs = packBatch([]string{"pw-ke-9", "abc", "", "defgh", "i", "jk", "lmnop", "q", "rs"})
+	if got := checkPasswordBatch(buf, offs, kdfTestSalt, ctPwKe9); got != 0 {
+		t.Errorf("planted di index 0: got %d", got)
+	}
+}
+
+// solver_aes_dec_cbc (AES-NI / ARMv8 CE) vs jalur software InvCipherBlock + XOR CBC,
+// key & data tetap (38 round, key 1024-bit), 6 blok = header 96 byte
+func TestDecryptCBCHardwareMatchesSoftware(t *testing.T) {
+	if !hwAES { t.Skip("CPU tanpa AES hardware") }
+	key, iv, in := make([]byte, 128), make([]byte, 16), make([]byte, 96)
+	for i := range key { key[i] = byte(i*13 + 5) }
+	for i := range iv { iv[i] = byte(0xf0 - i) }
+	for i := range in { in[i] = byte(i*i + 7*i + 1) }
+	aes := NewCustomAES(key, 38, 32)
+
+	hw := make([]byte, len(in))
+	aes.DecryptCBCHardware(iv, in, hw)
+
+	var sw []byte
+	prev := iv
+	for i := 0; i < len(in); i += 16 {
+		dec := aes.InvCipherBlock(in[i:i+16], false, true)
+		for j := range dec { dec[j] ^= prev[j] }
+		sw = append(sw, dec...)
+		prev = in[i : i+16]
+	}
+	if !bytes.Equal(hw, sw) {
+		t.Errorf("hardware:\n%x\nsoftware:\n%x", hw, sw)
+	}
+}
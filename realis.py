@@ -1,4 +1,3 @@
-import itertools
 import ctypes
 import os
 import sys
@@ -6,7 +5,34 @@ import time
 import base64
 import multiprocessing
 import json
+import struct
+import zlib
 import math
+import collections
+import contextlib
+import threading
+
+# psutil opsional: hitung core fisik di OS tanpa sysfs / sched_getaffinity
+try:
+    import psutil
+    PSUTIL_AVAIL = True
+except ImportError:
+    PSUTIL_AVAIL = False
+
+# GPU OFFLOAD (opsional, butuh pyopencl + numpy)
+try:
+    import numpy as np
+    import pyopencl as cl
+    OPENCL_AVAIL = True
+except ImportError:
+    OPENCL_AVAIL = False
+
+# Numba opsional: enumerasi permutasi producer GPU jadi kode native
+try:
+    from numba import njit
+    NUMBA_AVAIL = True
+except ImportError:
+    NUMBA_AVAIL = False
 
 # ==============================================================================
 # ⚙️ REALISTIC CONFIGURATION
@@ -15,7 +41,55 @@ LIB_PATH = "./solver_lib.so"
 KEYS_FILE = "keys-input.txt"
 MESSAGE_FILE = "message.b64"
 FILE_LOG_SUCCESS = "found.log"
-FILE_CHECKPOINT = "checkpoint.json"
+FILE_CHECKPOINT = "checkpoint.bin" # Bitmap: 1 bit per start-word unik
+FILE_CHECKPOINT_LEGACY = "checkpoint.json" # Format lama (list kata), dibaca sekali untuk migrasi
+CKPT_MAGIC = b"CKB1"
+CKPT_HDR_LEN = 8 # magic + crc32 daftar kata unik
+
+# Go cuma decrypt 96 byte awal ciphertext (header). Sisanya tidak pernah dibaca,
+# jadi tidak ikut disalin ke worker / ke Go tiap panggilan (cipher besar = TLB & copy boros)
+CIPHER_HEADER_LEN = 96
+
+# WORK STEALING: tiap blok start-word dipecah jadi >= sekian sub-blok kecil,
+# worker yang nganggur langsung ambil sub-blok berikutnya dari antrian Pool.
+SUBBLOCKS_PER_BLOCK = 64
+# Sub-blok per kiriman antrian Pool (chunksize imap_unordered): antrian input worker
+# tetap terisi tanpa round-trip per task. Dibatasi otomatis supaya tiap worker tetap
+# kebagian >= 4 kiriman (ekor pencarian tetap seimbang). Hasil 1 kiriman sampai di parent
+# bergerombol (back-to-back) -> speedometer wajib sampling per interval waktu
+# (SPEED_SAMPLE_INTERVAL), bukan per hasil.
+TASK_CHUNKSIZE = 8
+
+# WAJIB AES HARDWARE? (True = worker gagal start jika CPU tanpa AES-NI / ARMv8 CE)
+REQUIRE_AESNI = False
+
+# PREFILTER HEADER: tolak key dari 16 byte plaintext pertama (byte kontrol = pasti bukan teks).
+# Default False = scan pola 96 byte penuh untuk semua key (tanpa false negative). True hanya
+# jika plaintext target pasti teks sejak byte 0; hematnya kecil (<= 5 blok AES per kandidat)
+HEADER_PREFILTER = False
+
+# PIN WORKER: 1 worker = 1 core fisik (sibling SMT rebutan unit AES), dikunci via sched_setaffinity
+PIN_CORES = True
+
+# SPEEDOMETER: EWMA atas sampel Δchecked/Δt tiap SPEED_SAMPLE_INTERVAL detik (jam dinding).
+# Bukan per hasil: hasil datang bergerombol (chunksize, batch GPU), jeda antar hasil ~0.
+# ETA ikut speed terkini, bukan rata-rata sesi
+SPEED_EWMA_ALPHA = 0.1
+SPEED_SAMPLE_INTERVAL = 1.0
+RATE_HISTORY_LEN = 512 # Ring buffer (waktu, speed) untuk di-plot, ditulis saat exit
+FILE_RATE_HISTORY = "speed_history.csv"
+
+# DASHBOARD: main thread render tiap UI_INTERVAL detik (5 Hz), hasil dikuras thread drain
+UI_INTERVAL = 0.2
+# Batas tunggu thread drain saat exit. Setelah Ctrl+C iterator Pool yang sudah terminate tidak
+# pernah selesai, jadi cukup singkat: keamanan fd checkpoint dijamin lock, bukan join
+DRAIN_JOIN_TIMEOUT = 0.5
+
+# GPU OFFLOAD: jika ada device GPU OpenCL, Pool CPU dilewati dan semua kandidat dicek
+# di kernel solver_gpu.cl (1 work-item = 1 password, port 1:1 dari checkCore Go)
+USE_GPU = True
+GPU_KERNEL_FILE = "solver_gpu.cl"
+GPU_BATCH = 65536 # Kandidat per enqueue. KDF ~100rb hash/kandidat, batch 1M = menit tanpa update dashboard
 
 # ==============================================================================
 # GLOBAL SHARED VARIABLES
@@ -24,55 +98,325 @@ shared_lib = None
 shared_salt = None
 shared_cipher = None
 shared_cipher_len = None
+shared_words = None
+shared_words_b = None
+
+def physical_cores():
+    """1 logical CPU per core fisik (sibling SMT dibuang), dibaca dari sysfs Linux"""
+    if not hasattr(os, "sched_getaffinity"):
+        n = (psutil.cpu_count(logical=False) if PSUTIL_AVAIL else None) or multiprocessing.cpu_count()
+        return list(range(n))
+    cores, seen = [], set()
+    for cpu in sorted(os.sched_getaffinity(0)):
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                siblings = f.read().strip()
+        except OSError:
+            siblings = str(cpu)
+        if siblings not in seen:
+            seen.add(siblings)
+            cores.append(cpu)
+    return cores
 
-def init_worker(salt_raw, cipher_raw):
-    """Inisialisasi Worker: Load Lib & Data Read-Only"""
-    global shared_lib, shared_salt, shared_cipher, shared_cipher_len
+def pin_to_core(core_id):
+    """Kunci proses ke 1 core (x86 & ARM Linux), no-op di OS tanpa sched_setaffinity"""
+    if core_id is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {core_id})
+    except OSError:
+        pass
+
+def init_worker(salt_raw, cipher_raw, words, cores, slot_counter):
+    """Inisialisasi Worker: Pin Core, Load Lib & Data Read-Only"""
+    global shared_lib, shared_salt, shared_cipher, shared_cipher_len, shared_words, shared_words_b
+    
+    # Pool tidak memberi nomor worker, jadi ambil slot core dari counter bersama
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+    if PIN_CORES:
+        pin_to_core(cores[slot % len(cores)])
     
     try:
         shared_lib = ctypes.CDLL(LIB_PATH)
-        shared_lib.CheckPassword.argtypes = [
-            ctypes.c_char_p, ctypes.POINTER(ctypes.c_ubyte),
-            ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int
+        shared_lib.CheckPermutationBlock.argtypes = [
+            ctypes.POINTER(ctypes.c_char_p), ctypes.c_int, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_int), ctypes.c_int,
+            ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int,
+            ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_longlong)
         ]
-        shared_lib.CheckPassword.restype = ctypes.c_int
+        shared_lib.CheckPermutationBlock.restype = ctypes.c_int
+        shared_lib.HasAESNI.restype = ctypes.c_int
+        shared_lib.SetHeaderPrefilter.argtypes = [ctypes.c_int]
+        shared_lib.SetHeaderPrefilter.restype = None
+        shared_lib.SetHeaderPrefilter(1 if HEADER_PREFILTER else 0)
     except Exception as e:
         # Critical failure, raise to parent
         raise RuntimeError(f"Worker Init Failed: {e}")
 
+    # Probe AES hardware cukup sekali di sini, tidak ada cek CPU di hot path
+    if not shared_lib.HasAESNI():
+        if REQUIRE_AESNI:
+            raise RuntimeError("Worker Init Failed: AES-NI / ARMv8 CE tidak tersedia")
+        print(f"\n[WARN] Worker {os.getpid()}: AES hardware tidak terdeteksi, pakai AES software.")
+
     shared_salt = (ctypes.c_ubyte * 8)(*salt_raw)
     shared_cipher_len = len(cipher_raw)
     shared_cipher = (ctypes.c_ubyte * shared_cipher_len)(*cipher_raw)
+    # Array char* dibangun sekali saja, dipakai ulang oleh semua blok
+    shared_words_b = [w.encode('utf-8') for w in words]
+    shared_words = (ctypes.c_char_p * len(words))(*shared_words_b)
 
 def worker_task(task_data):
     """
-    Mengerjakan 1 Blok (Dimulai dengan kata tertentu).
-    Tidak ada disk I/O untuk log gagal. Murni CPU.
+    Mengerjakan 1 Sub-Blok (prefix index tetap, diawali start-word tertentu).
+    Seluruh loop permutasi berjalan di Go (1x panggilan ctypes per sub-blok).
+    Task cuma tuple index prefix, daftar kata sudah ada di worker sejak init.
     """
-    start_word, all_words, r = task_data
+    prefix_idx = task_data
+    n_words = len(shared_words_b)
     
-    # Siapkan list kata sisa
-    remaining_words = list(all_words)
-    remaining_words.remove(start_word)
+    prefix = (ctypes.c_int * len(prefix_idx))(*prefix_idx)
+    match_idx = (ctypes.c_int * n_words)()
+    local_count = ctypes.c_longlong(0)
     
-    local_count = 0
+    match = shared_lib.CheckPermutationBlock(
+        shared_words, n_words, n_words, prefix, len(prefix_idx),
+        shared_salt, shared_cipher, shared_cipher_len,
+        match_idx, ctypes.byref(local_count)
+    )
     
-    # Loop Permutasi (Heavy CPU Loop)
-    for p in itertools.permutations(remaining_words, r - 1):
-        # String concatenation di Python cukup cepat untuk short strings
-        password_str = start_word + "".join(p)
-        pass_c = password_str.encode('utf-8')
-        
-        # Panggil C Function (Zero overhead memory copy karena pointer)
-        match = shared_lib.CheckPassword(pass_c, shared_salt, shared_cipher, shared_cipher_len)
-        local_count += 1
-        
-        if match == 1:
-            return (True, password_str, local_count, start_word)
-            
-        # Optional: Update status internal worker (bisa di-skip demi speed)
+    start_idx = prefix_idx[0]
+    if match < 0:
+        raise RuntimeError(f"CheckPermutationBlock: argumen invalid (prefix {prefix_idx})")
+    if match == 1:
+        password_str = b"".join(shared_words_b[i] for i in match_idx).decode('utf-8')
+        return (True, password_str, local_count.value, start_idx)
     
-    return (False, None, local_count, start_word)
+    return (False, None, local_count.value, start_idx)
+
+def subblock_prefix_len(n_words, target):
+    """Panjang prefix (>= 1) agar 1 blok start-word terpecah jadi >= target sub-blok"""
+    d, parts = 1, 1
+    while parts < target and d < n_words:
+        parts *= n_words - d
+        d += 1
+    return d
+
+def pwrite(fd, data, offset):
+    """os.pwrite, fallback lseek + write di OS tanpa pwrite (Windows)"""
+    if hasattr(os, "pwrite"):
+        os.pwrite(fd, data, offset)
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        os.write(fd, data)
+
+def open_checkpoint(uniq_words):
+    """
+    Buka/buat bitmap checkpoint. Bit ke-c = blok start-word uniq_words[c] selesai.
+    Header berisi crc32 daftar kata, jadi checkpoint dari keys-input lain tidak terpakai.
+    Return (fd, mask) - fd tetap terbuka untuk update 1 byte per blok.
+    """
+    header = CKPT_MAGIC + struct.pack("<I", zlib.crc32("\n".join(uniq_words).encode('utf-8')))
+    mask = bytearray((len(uniq_words) + 7) // 8)
+    fd = os.open(FILE_CHECKPOINT, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    data = os.read(fd, CKPT_HDR_LEN + len(mask) + 1)
+    if len(data) == CKPT_HDR_LEN + len(mask) and data[:CKPT_HDR_LEN] == header:
+        mask[:] = data[CKPT_HDR_LEN:]
+        return fd, mask
+
+    if data:
+        print("[WARN] Checkpoint tidak cocok dengan keys-input, reset ulang.")
+    elif os.path.exists(FILE_CHECKPOINT_LEGACY):
+        try:
+            with open(FILE_CHECKPOINT_LEGACY, "r") as f:
+                legacy = set(json.load(f))
+            for c, w in enumerate(uniq_words):
+                if w in legacy: mask[c >> 3] |= 1 << (c & 7)
+        except:
+            print("[WARN] Checkpoint lama corrupt, diabaikan.")
+    os.ftruncate(fd, 0)
+    pwrite(fd, header + bytes(mask), 0)
+    return fd, mask
+
+def mark_block_done(fd, mask, c):
+    """Set bit blok ke-c: cuma 1 byte yang ditulis ulang (O(1), tidak ada rewrite file)"""
+    mask[c >> 3] |= 1 << (c & 7)
+    pwrite(fd, bytes([mask[c >> 3]]), CKPT_HDR_LEN + (c >> 3))
+
+def multiset_perms(counts):
+    """Jumlah urutan unik dari multiset: n! / prod(c!) (= n! jika semua kata unik)"""
+    total = math.factorial(sum(counts))
+    for c in counts:
+        total //= math.factorial(c)
+    return total
+
+def multiset_prefixes(counts, m):
+    """Semua urutan unik sepanjang m dari multiset counts (dict kata -> sisa jumlah)"""
+    if m == 0:
+        yield ()
+        return
+    for w in counts:
+        if counts[w]:
+            counts[w] -= 1
+            for tail in multiset_prefixes(counts, m - 1):
+                yield (w,) + tail
+            counts[w] += 1
+
+def block_perms(word_counts, w):
+    """Jumlah urutan unik di blok start-word w"""
+    return multiset_perms([c - (k == w) for k, c in word_counts.items()])
+
+def open_gpu(defines=None):
+    """
+    Cari device GPU OpenCL & build kernel. defines = konstanta run (-D) untuk spesialisasi
+    kernel saat runtime. Return (ctx, queue, program, nama device) atau None
+    """
+    if not OPENCL_AVAIL or not os.path.exists(GPU_KERNEL_FILE):
+        return None
+    try:
+        devices = [d for p in cl.get_platforms() for d in p.get_devices(device_type=cl.device_type.GPU)]
+    except cl.Error:
+        return None
+    if not devices:
+        return None
+    dev, prog = devices[0], None
+    try:
+        ctx = cl.Context([dev])
+        with open(GPU_KERNEL_FILE, "r") as f:
+            prog = cl.Program(ctx, f.read())
+        prog.build(options=[f"-D{k}={v}" for k, v in (defines or {}).items()])
+        return ctx, cl.CommandQueue(ctx), prog, dev.name.strip()
+    except (cl.Error, OSError) as e:
+        # Compiler vendor menolak kernel / file kernel hilang: run tetap jalan di Pool CPU
+        # Pesan cl.Error bisa ikut membawa build log: cukup baris pertama, log dicetak di bawah
+        reason = (str(e).strip().splitlines() or [type(e).__name__])[0]
+        print(f"[WARN] GPU {dev.name.strip()} tidak dipakai, fallback ke CPU: {reason}")
+        if prog is not None:
+            try:
+                build_log = prog.get_build_info(dev, cl.program_build_info.LOG).strip()
+            except cl.Error:
+                build_log = ""
+            if build_log: print(build_log)
+        return None
+
+def fill_suffix_perms(perm, out):
+    """
+    Tulis urutan unik berikutnya (leksikografis, next-permutation) dari perm (id kelas kata,
+    uint8) ke baris-baris out yang sudah dialokasikan. perm dimulai dari urutan terurut dan
+    selalu berisi urutan berikutnya yang belum ditulis. Return (jumlah baris, habis?).
+    """
+    n = perm.shape[0]
+    cnt = 0
+    while cnt < out.shape[0]:
+        out[cnt, :] = perm
+        cnt += 1
+        i = n - 2
+        while i >= 0 and perm[i] >= perm[i + 1]:
+            i -= 1
+        if i < 0:
+            return cnt, True
+        j = n - 1
+        while perm[j] <= perm[i]:
+            j -= 1
+        perm[i], perm[j] = perm[j], perm[i]
+        a, b = i + 1, n - 1
+        while a < b:
+            perm[a], perm[b] = perm[b], perm[a]
+            a += 1
+            b -= 1
+    return cnt, False
+
+if NUMBA_AVAIL:
+    fill_suffix_perms = njit(cache=True)(fill_suffix_perms)
+
+def gpu_results(gpu, tasks, words, salt_raw, cipher_raw):
+    """
+    Pengganti pool.imap_unordered di jalur GPU: kandidat tiap sub-blok dibangkitkan di CPU,
+    dikirim per GPU_BATCH ke kernel. Yield format worker_task (found, pw, count, start_idx);
+    start_idx None = progress parsial sub-blok yang belum selesai (tanpa checkpoint).
+    """
+    ctx, queue, prog, _ = gpu
+    mf = cl.mem_flags
+    const_buf = lambda b: cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=np.frombuffer(b, dtype=np.uint8))
+    salt_d, cipher_d = const_buf(salt_raw), const_buf(cipher_raw)
+    found_h = np.zeros(1, dtype=np.int32)
+    found_d = cl.Buffer(ctx, mf.READ_WRITE, found_h.nbytes)
+
+    # Kata kembar = 1 kelas (sama dengan jalur Go), urutan kelas = kemunculan pertama.
+    # Tabel SoA: W[kelas] = byte kata (padding 0), lens[kelas]; semua kandidat memakai semua
+    # kata jadi panjang password konstan -> batch = matriks (GPU_BATCH, pw_len) tanpa offset.
+    class_id = {w: c for c, w in enumerate(dict.fromkeys(words))}
+    class_of = [class_id[w] for w in words]
+    class_b = [w.encode('utf-8') for w in class_id]
+    lens = np.array([len(b) for b in class_b])
+    W = np.zeros((len(class_b), lens.max()), dtype=np.uint8)
+    for c, b in enumerate(class_b): W[c, :len(b)] = np.frombuffer(b, dtype=np.uint8)
+    W_mask = np.arange(W.shape[1]) < lens[:, None] # byte valid (bukan padding) per kelas
+    pw_len = int(lens[class_of].sum())
+
+    # Buffer dialokasikan 1x: matriks index permutasi (kelas per posisi), batch password, owner
+    n_words, n_head = len(words), len(tasks[0])
+    idx = np.empty((GPU_BATCH, n_words), dtype=np.uint8)
+    batch = np.empty((GPU_BATCH, pw_len), dtype=np.uint8)
+    owners = np.empty(GPU_BATCH, dtype=np.int64) # owners[i] = start_idx kandidat ke-i
+    pw_d = cl.Buffer(ctx, mf.READ_ONLY, batch.nbytes)
+
+    def run_batch(n):
+        found_h[0] = n
+        cl.enqueue_copy(queue, found_d, found_h)
+        cl.enqueue_copy(queue, pw_d, batch[:n])
+        prog.check_candidates(queue, (n,), None, pw_d, np.uint32(pw_len), np.int32(n),
+                              salt_d, cipher_d, np.int32(len(cipher_raw)), found_d)
+        cl.enqueue_copy(queue, found_h, found_d)
+        queue.finish()
+        return int(found_h[0]) if found_h[0] < n else -1
+
+    def hit_results(hit):
+        """
+        Kandidat 0..hit batch ini sudah dicek: sub-blok closed yang habis sebelum hit tetap
+        di-yield (checkpoint), sisanya (sub-blok milik hit) jadi hitungan hasil match.
+        """
+        end = 0
+        for si, c in closed: # urutan closed = urutan kandidat di batch
+            if end + c > hit: break
+            end += c
+            yield (False, None, c, si)
+        yield (True, batch[hit].tobytes().decode('utf-8'), hit + 1 - end, int(owners[hit]))
+
+    filled = 0
+    closed = [] # (start_idx, jumlah) sub-blok yang semua kandidatnya sudah di buffer
+    open_count = 0 # kandidat sub-blok berjalan yang sudah masuk buffer
+    for prefix_idx in tasks:
+        head = [class_of[i] for i in prefix_idx]
+        used = set(prefix_idx)
+        perm = np.array(sorted(class_of[i] for i in range(n_words) if i not in used), dtype=np.uint8)
+        done = False
+        while not done:
+            cnt, done = fill_suffix_perms(perm, idx[filled:, n_head:])
+            end = filled + cnt
+            idx[filled:end, :n_head] = head
+            # Gather W[idx] lalu buang padding: urutan C (baris, kata, byte) = password berurutan
+            sel = idx[filled:end]
+            batch[filled:end] = W[sel][W_mask[sel]].reshape(cnt, pw_len)
+            owners[filled:end] = prefix_idx[0]
+            filled = end
+            open_count += cnt
+            if filled == GPU_BATCH:
+                hit = run_batch(filled)
+                if hit >= 0:
+                    yield from hit_results(hit); return
+                for si, c in closed: yield (False, None, c, si)
+                yield (False, None, open_count, None) # progress parsial, sub-blok belum selesai
+                filled, closed, open_count = 0, [], 0
+        closed.append((prefix_idx[0], open_count))
+        open_count = 0
+    if filled:
+        hit = run_batch(filled)
+        if hit >= 0:
+            yield from hit_results(hit); return
+    for si, c in closed: yield (False, None, c, si)
 
 def format_time(seconds):
     """Helper untuk format waktu manusiawi"""
@@ -82,6 +426,12 @@ def format_time(seconds):
     if seconds < 31536000: return f"{seconds/86400:.1f} days"
     return f"{seconds/31536000:.1f} YEARS"
 
+def format_speed(rate):
+    """Helper format speed: KDF berat -> ratusan H/s per core, GPU bisa sampai M/s"""
+    if rate < 1000: return f"{rate:.1f} H/s"
+    if rate < 1_000_000: return f"{rate/1000:.1f} k/s"
+    return f"{rate/1_000_000:.2f}M/s"
+
 # ==============================================================================
 # MAIN SYSTEM
 # ==============================================================================
@@ -102,7 +452,7 @@ def main():
         with open(MESSAGE_FILE, "r") as f:
             raw = base64.b64decode(f.read().strip())
         salt_bytes = raw[8:16]
-        cipher_bytes = raw[16:]
+        cipher_bytes = raw[16:16 + CIPHER_HEADER_LEN]
     except Exception as e:
         print(f"[FATAL] Message corrupt: {e}"); return
 
@@ -110,11 +460,13 @@ def main():
         words = [line.strip() for line in f if line.strip()]
     
     n_words = len(words)
-    total_combinations = math.factorial(n_words)
+    # Kata kembar: urutan yang cuma beda posisi kata kembar identik, jadi hanya urutan unik
+    word_counts = collections.Counter(words)
+    total_combinations = multiset_perms(list(word_counts.values()))
 
     # 3. REALITY CHECK (SANGAT PENTING)
-    print(f"[INPUT] {n_words} Kata Unik")
-    print(f"[SCOPE] {total_combinations:,} Kombinasi Total (N!)")
+    print(f"[INPUT] {n_words} Kata ({len(word_counts)} Unik)")
+    print(f"[SCOPE] {total_combinations:,} Kombinasi Total (N! / kata kembar)")
     
     # Asumsi speed single core Go AES modern ~2-5 Juta/detik
     # Total system speed estimasi (misal 8 core) ~ 20 Juta/detik
@@ -127,33 +479,68 @@ def main():
         print("Lanjutkan hanya jika Anda yakin password tidak menggunakan semua kata.")
         input("Tekan ENTER untuk nekat lanjut, atau Ctrl+C untuk batal...")
 
-    # 4. CHECKPOINT SYSTEM
-    completed_blocks = []
-    if os.path.exists(FILE_CHECKPOINT):
-        try:
-            with open(FILE_CHECKPOINT, "r") as f:
-                completed_blocks = json.load(f)
-            print(f"[RESUME] Melanjutkan dari {len(completed_blocks)}/{n_words} blok tersimpan.")
-        except:
-            print("[WARN] Checkpoint corrupt, reset ulang.")
-            completed_blocks = []
+    # 4. CHECKPOINT SYSTEM (bitmap, urutan bit = urutan kemunculan pertama kata unik)
+    uniq_words = list(word_counts)
+    ckpt_fd, ckpt_mask = open_checkpoint(uniq_words)
+    completed_blocks = [w for c, w in enumerate(uniq_words) if ckpt_mask[c >> 3] >> (c & 7) & 1]
+    if completed_blocks:
+        print(f"[RESUME] Melanjutkan dari {len(completed_blocks)}/{len(word_counts)} blok tersimpan.")
 
-    # 5. TASK GENERATION
+    # 5. TASK GENERATION (SUB-BLOK)
+    # Prefix diperpanjang supaya tiap blok start-word jadi banyak sub-blok kecil.
+    # Antrian task Pool dibagi semua worker, jadi tidak ada core yang nganggur
+    # menunggu 1 blok raksasa terakhir selesai.
+    # Blok & prefix dibentuk per kata unik: kata kembar tidak bikin blok/sub-blok dobel.
+    prefix_len = subblock_prefix_len(n_words, SUBBLOCKS_PER_BLOCK)
+    class_idx = {} # kata -> daftar index kemunculannya
+    for i, w in enumerate(words):
+        class_idx.setdefault(w, []).append(i)
     tasks = []
-    for w in words:
+    pending_subs = {} # start_idx -> sisa sub-blok yang belum selesai
+    block_bit = {} # start_idx -> index bit di checkpoint
+    for c, (w, idxs) in enumerate(class_idx.items()):
         if w in completed_blocks: continue
-        tasks.append((w, words, n_words))
+        si = idxs[0]
+        block_bit[si] = c
+        rest = dict(word_counts)
+        rest[w] -= 1
+        pending_subs[si] = 0
+        for tail in multiset_prefixes(rest, prefix_len - 1):
+            # Kata -> index konkret, kata kembar ambil index berikutnya yang belum dipakai
+            taken = {w: 1}
+            prefix = [si]
+            for tw in tail:
+                prefix.append(class_idx[tw][taken.get(tw, 0)])
+                taken[tw] = taken.get(tw, 0) + 1
+            tasks.append(tuple(prefix))
+            pending_subs[si] += 1
 
     if not tasks:
         print("[INFO] Semua tugas sudah selesai menurut checkpoint.")
+        os.close(ckpt_fd)
         return
 
+    # GPU tersedia -> Pool CPU tidak dipakai sama sekali. Kernel di-build khusus run ini:
+    # panjang password (semua kata), panjang header & salt jadi konstanta compile-time
+    gpu = open_gpu({
+        "PW_LEN": sum(len(w.encode('utf-8')) for w in words),
+        "CIPHER_LEN": len(cipher_bytes),
+        "SALT_INIT": ",".join(f"0x{b:02x}" for b in salt_bytes),
+        "HEADER_PREFILTER": int(HEADER_PREFILTER),
+    }) if USE_GPU else None
+
     # 6. WORKER SETUP (NO OVERDRIVE)
-    # Gunakan jumlah core fisik asli. Overcommit hanya menambah latency.
-    total_workers = multiprocessing.cpu_count()
+    # Gunakan jumlah core fisik asli (tanpa sibling SMT). Overcommit hanya menambah latency.
+    cores = physical_cores()
+    total_workers = len(cores)
+    slot_counter = multiprocessing.Value('i', 0)
     
     print("-" * 60)
-    print(f"[ENGINE] CPU Cores : {total_workers}")
+    if gpu:
+        print(f"[ENGINE] GPU : {gpu[3]} (OpenCL, batch {GPU_BATCH:,})")
+    else:
+        print(f"[ENGINE] CPU Cores : {total_workers} (Fisik{', Pinned' if PIN_CORES else ''})")
+    print(f"[ENGINE] Sub-Blok : {len(tasks):,} total ({len(pending_subs)} start-word)")
     print(f"[ENGINE] I/O Logging : DISABLED (Demi Speed)")
     print("-" * 60)
     time.sleep(1)
@@ -162,72 +549,141 @@ def main():
     start_time = time.time()
     
     # Hitung base progress dari checkpoint
-    perms_per_block = math.factorial(n_words - 1)
-    total_checked = len(completed_blocks) * perms_per_block
+    total_checked = sum(block_perms(word_counts, w) for w in set(completed_blocks) if w in word_counts)
     
     # Session metrics
     session_checked = 0
     session_start = time.time()
+    speed_ewma = 0.0
+    last_sample_t, last_sample_checked = session_start, 0
+    rate_history = collections.deque(maxlen=RATE_HISTORY_LEN)
+    # Konstanta float dihitung 1x: tidak ada pembagian / pengurangan bignum (N!) tiap render
+    total_f = float(total_combinations)
+    inv_total_pct = 100.0 / total_f
+
+    found_pw = None
+    drain_error = None
+    done = threading.Event() # hasil habis / password ketemu / error / dihentikan user
+    drain_thread = None
+    # mark_block_done (thread drain) vs fsync/close fd (main thread): fd yang sudah ditutup
+    # bisa dipakai ulang file lain, jadi tulis checkpoint hanya saat ckpt_open di bawah lock
+    ckpt_lock = threading.Lock()
+    ckpt_open = True
+
+    def drain(result_iterator):
+        """
+        Thread penguras hasil worker: counter & checkpoint diupdate di sini sehingga
+        biaya render UI tidak pernah menahan antrian hasil (worker tidak ikut menunggu).
+        """
+        nonlocal total_checked, session_checked, found_pw, drain_error
+        try:
+            for is_found, pw, count, start_idx in result_iterator:
+                if done.is_set(): return # Ctrl+C / exit di main thread
 
-    with multiprocessing.Pool(processes=total_workers, initializer=init_worker, initargs=(salt_bytes, cipher_bytes)) as pool:
-        
-        # Gunakan imap_unordered agar responsif
-        result_iterator = pool.imap_unordered(worker_task, tasks)
-        
-        while True:
-            try:
-                # Update Dashboard (Non-blocking visual update)
-                elapsed = time.time() - session_start
-                if elapsed < 1: elapsed = 1
-                
-                speed = session_checked / elapsed
-                
-                # Estimasi Sisa Waktu (ETA)
-                remaining_combs = total_combinations - total_checked
-                eta_seconds = remaining_combs / speed if speed > 0 else 0
-                eta_str = format_time(eta_seconds)
-
-                # Format Angka
-                percent = (total_checked / total_combinations) * 100
-                speed_str = f"{speed/1_000_000:.2f}M/s" # Tampilkan dalam Juta/detik
-                
-                # Simple clean bar
-                sys.stdout.write(f"\rProg: {percent:5.2f}% | Spd: {speed_str} | ETA: {eta_str} | Chk: {total_checked:,}   ")
-                sys.stdout.flush()
-
-                # BLOCKING CALL - Menunggu 1 worker selesai mengerjakan 1 blok
-                # Kita tidak pakai timeout agar efisien CPU, update visual hanya terjadi
-                # setiap kali ada blok yang selesai (atau bisa pakai thread terpisah u/ visual, tapi ini simpler)
-                
-                res = next(result_iterator) # <--- Critical Fix Python 3
-                
-                is_found, pw, count, finished_word = res
-                
                 total_checked += count
                 session_checked += count
-                
+
                 if is_found:
-                    print(f"\n\n[🔥 MATCH FOUND 🔥] {pw}")
-                    with open(FILE_LOG_SUCCESS, "w") as f:
-                        f.write(pw)
-                    pool.terminate()
-                    break
-                
-                # Save Checkpoint (Hanya start_word)
-                completed_blocks.append(finished_word)
-                with open(FILE_CHECKPOINT, "w") as f:
-                    json.dump(completed_blocks, f)
-
-            except StopIteration:
-                break
+                    found_pw = pw
+                    return
+
+                # Save Checkpoint (Hanya start_word, setelah SEMUA sub-bloknya selesai)
+                if start_idx is None: continue
+                with ckpt_lock:
+                    if not ckpt_open: return
+                    pending_subs[start_idx] -= 1
+                    if pending_subs[start_idx] == 0:
+                        mark_block_done(ckpt_fd, ckpt_mask, block_bit[start_idx])
+        except Exception as e:
+            drain_error = e
+        finally:
+            done.set()
+
+    def sample_speed():
+        """Sampel speed maks 1x per SPEED_SAMPLE_INTERVAL: Δchecked / Δt jam dinding masuk EWMA"""
+        nonlocal speed_ewma, last_sample_t, last_sample_checked
+        now = time.time()
+        dt = now - last_sample_t
+        if dt < SPEED_SAMPLE_INTERVAL: return
+        checked = session_checked
+        inst = (checked - last_sample_checked) / dt
+        last_sample_t, last_sample_checked = now, checked
+        # Seed = rata-rata sejak start sesi (tanpa bias ke 0, dan 1 gerombolan hasil di
+        # sampel pertama tidak dianggap speed)
+        if speed_ewma == 0: speed_ewma = checked / (now - session_start)
+        else: speed_ewma = (1 - SPEED_EWMA_ALPHA) * speed_ewma + SPEED_EWMA_ALPHA * inst
+        rate_history.append((now - session_start, speed_ewma))
+
+    def render():
+        """1 baris dashboard: hitung ETA/persen & format string hanya saat benar-benar ditampilkan"""
+        elapsed = time.time() - session_start
+        if elapsed < 1: elapsed = 1
+    
+        # Rata-rata sesi cuma untuk display; total_checked ikut hitungan checkpoint,
+        # jadi tidak boleh dibagi waktu sesi
+        session_rate = session_checked / elapsed
+    
+        # Estimasi Sisa Waktu (ETA) dari speed EWMA
+        remaining_combs = total_f - total_checked
+        eta_str = format_time(remaining_combs / speed_ewma) if speed_ewma > 0 else "-" # belum ada sampel
+
+        # Format Angka
+        percent = total_checked * inv_total_pct
+        speed_str = f"{format_speed(speed_ewma)} (avg {format_speed(session_rate)})"
+    
+        # Simple clean bar
+        sys.stdout.write(f"\rProg: {percent:5.2f}% | Spd: {speed_str} | ETA: {eta_str} | Chk: {total_checked:,}   ")
+        sys.stdout.flush()
+
+    try:
+        with (contextlib.nullcontext() if gpu else multiprocessing.Pool(processes=total_workers, initializer=init_worker, initargs=(salt_bytes, cipher_bytes, words, cores, slot_counter))) as pool:
+        
+            # Gunakan imap_unordered agar responsif (jalur GPU: generator dengan format hasil sama)
+            if gpu:
+                result_iterator = gpu_results(gpu, tasks, words, salt_bytes, cipher_bytes)
+            else:
+                # Hasil per kiriman datang bergerombol; aman karena speed disampling di sample_speed()
+                chunksize = max(1, min(TASK_CHUNKSIZE, len(tasks) // (total_workers * 4)))
+                result_iterator = pool.imap_unordered(worker_task, tasks, chunksize=chunksize)
+
+            drain_thread = threading.Thread(target=drain, args=(result_iterator,), daemon=True)
+            drain_thread.start()
+            try:
+                # Main thread cuma render dari counter (5 Hz), tidak pernah blocking di hasil worker
+                while not done.wait(UI_INTERVAL):
+                    sample_speed()
+                    render()
             except KeyboardInterrupt:
-                pool.terminate()
+                done.set()
+                if pool: pool.terminate()
                 print("\n\n[STOP] Dihentikan user.")
                 return
-            except Exception as e:
-                print(f"\n[ERROR] {e}")
-                pool.terminate()
+
+            if drain_error is not None:
+                print(f"\n[ERROR] {drain_error}")
+                if pool: pool.terminate()
                 return
+            if found_pw is not None:
+                print(f"\n\n[🔥 MATCH FOUND 🔥] {found_pw}")
+                with open(FILE_LOG_SUCCESS, "w") as f:
+                    f.write(found_pw)
+                if pool: pool.terminate()
+            else:
+                render() # Status akhir selalu tampil walau interval belum lewat
+    finally:
+        # Pool sudah terminate (keluar dari with): tunggu thread drain berhenti. Kalau masih
+        # tertahan (iterator Pool / batch GPU), lock + ckpt_open menolak tulisan setelah close
+        done.set()
+        if drain_thread: drain_thread.join(DRAIN_JOIN_TIMEOUT)
+        with ckpt_lock:
+            ckpt_open = False
+            # fsync cukup sekali saat exit, update per blok sudah langsung ke file
+            os.fsync(ckpt_fd)
+            os.close(ckpt_fd)
+        if rate_history:
+            with open(FILE_RATE_HISTORY, "w") as f:
+                f.write("detik,speed\n")
+                f.writelines(f"{t:.1f},{v:.1f}\n" for t, v in rate_history)
 
     print("\n" + "="*60)
     print("PENCARIAN SELESAI.")
@@ -237,4 +693,8 @@ def main():
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()
+    # fork (Linux): worker mewarisi data parent copy-on-write, args tidak di-pickle ulang.
+    # Python 3.14+ default ke forkserver di Linux, jadi dipaksa di sini.
+    if "fork" in multiprocessing.get_all_start_methods():
+        multiprocessing.set_start_method("fork", force=True)
     main()
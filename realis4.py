@@ -1,12 +1,15 @@
-import itertools
 import ctypes
 import os
 import sys
 import time
 import base64
 import multiprocessing
+import threading
+import contextlib
+from multiprocessing import shared_memory
 import json
 import math
+import collections
 
 # Cek library psutil
 try:
@@ -15,6 +18,14 @@ try:
 except ImportError:
     PSUTIL_AVAIL = False
 
+# Numba opsional: loop permutasi + rakit buffer jadi kode native
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAIL = True
+except ImportError:
+    NUMBA_AVAIL = False
+
 # ==============================================================================
 # ⚙️ KONFIGURASI
 # ==============================================================================
@@ -22,11 +33,28 @@ LIB_PATH = "./solver_lib.so"
 KEYS_FILE = "keys-input.txt"
 MESSAGE_FILE = "message.b64"
 FILE_LOG_SUCCESS = "found.log"
-FILE_LOG_FAILED = "failed.log"
+FILE_LOG_FAILED = "failed.log" # + ".<pid>" per worker
 FILE_CHECKPOINT = "checkpoint.json"
+CIPHER_HEADER_LEN = 96 # Go cuma decrypt 96 byte awal, sisa ciphertext tidak dikirim
+
+# WAJIB AES HARDWARE? (True = worker gagal start jika CPU tanpa AES-NI / ARMv8 CE)
+REQUIRE_AESNI = False
+
+# PREFILTER HEADER: tolak key dari 16 byte plaintext pertama (byte kontrol = pasti bukan teks).
+# Default False = scan pola 96 byte penuh untuk semua key (tanpa false negative). True hanya
+# jika plaintext target pasti teks sejak byte 0; hematnya kecil (<= 5 blok AES per kandidat)
+HEADER_PREFILTER = False
+
+# PIN WORKER: 1 worker = 1 core fisik (sibling SMT rebutan unit AES), dikunci via sched_setaffinity
+PIN_CORES = True
 
-ENABLE_FAILED_LOG = True 
-BATCH_SIZE = 50 
+ENABLE_FAILED_LOG = False # Log penuh mustahil untuk N!, cuma sampel
+FAILED_LOG_SAMPLE = 4096 # 1 dari sekian kandidat gagal (pangkat 2)
+BATCH_SIZE = 64 
+CHECK_PER_CALL = 64 # Password per 1x panggilan CheckPasswordBatch
+
+# Interval refresh dashboard (detik), dirender di thread terpisah
+DASHBOARD_INTERVAL = 0.5
 
 # ==============================================================================
 # GLOBAL SHARED VARIABLES
@@ -35,52 +63,352 @@ shared_lib = None
 shared_salt = None
 shared_cipher = None
 shared_cipher_len = None
+shared_words_shm = None
+shared_words_b = None
+shared_word_counts = None
+shared_words_np = None
+shared_woffs_np = None
+shared_log_fd = None # fd log gagal per worker (O_APPEND), dibuka di init_worker
+shared_pw_len = None
+shared_batch_buf = None
+shared_batch_addr = None
+shared_batch_offs = None
+
+def physical_cores():
+    """1 logical CPU per core fisik (sibling SMT dibuang), dibaca dari sysfs Linux"""
+    if not hasattr(os, "sched_getaffinity"):
+        n = (psutil.cpu_count(logical=False) if PSUTIL_AVAIL else None) or multiprocessing.cpu_count()
+        return list(range(n))
+    cores, seen = [], set()
+    for cpu in sorted(os.sched_getaffinity(0)):
+        try:
+            with open(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list") as f:
+                siblings = f.read().strip()
+        except OSError:
+            siblings = str(cpu)
+        if siblings not in seen:
+            seen.add(siblings)
+            cores.append(cpu)
+    return cores
 
-def init_worker(salt_raw, cipher_raw):
-    global shared_lib, shared_salt, shared_cipher, shared_cipher_len
+def pin_to_core(core_id):
+    """Kunci proses ke 1 core (x86 & ARM Linux), no-op di OS tanpa sched_setaffinity"""
+    if core_id is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {core_id})
+    except OSError:
+        pass
+
+def init_worker(salt_raw, cipher_raw, shm_name, word_offs, word_counts, core_id=None):
+    global shared_lib, shared_salt, shared_cipher, shared_cipher_len, shared_words_shm, shared_words_b, shared_word_counts
+    global shared_words_np, shared_woffs_np
+    global shared_pw_len, shared_batch_buf, shared_batch_addr, shared_batch_offs
+    global shared_log_fd
+    pin_to_core(core_id)
     try:
         shared_lib = ctypes.CDLL(LIB_PATH)
-        shared_lib.CheckPassword.argtypes = [
-            ctypes.c_char_p, 
+        shared_lib.CheckPasswordBatch.argtypes = [
+            ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_uint32), ctypes.c_int,
             ctypes.POINTER(ctypes.c_ubyte), 
             ctypes.POINTER(ctypes.c_ubyte), 
             ctypes.c_int
         ]
-        shared_lib.CheckPassword.restype = ctypes.c_int
+        shared_lib.CheckPasswordBatch.restype = ctypes.c_int
+        shared_lib.HasAESNI.restype = ctypes.c_int
+        shared_lib.SetHeaderPrefilter.argtypes = [ctypes.c_int]
+        shared_lib.SetHeaderPrefilter.restype = None
+        shared_lib.SetHeaderPrefilter(1 if HEADER_PREFILTER else 0)
     except Exception as e:
         raise RuntimeError(f"Worker Init Failed: {e}")
 
+    # Probe AES hardware cukup sekali di sini, tidak ada cek CPU di hot path
+    if not shared_lib.HasAESNI():
+        if REQUIRE_AESNI:
+            raise RuntimeError("Worker Init Failed: AES-NI / ARMv8 CE tidak tersedia")
+        print(f"\n[WARN] Worker {os.getpid()}: AES hardware tidak terdeteksi, pakai AES software.")
+
     shared_salt = (ctypes.c_ubyte * 8)(*salt_raw)
     shared_cipher_len = len(cipher_raw)
     shared_cipher = (ctypes.c_ubyte * shared_cipher_len)(*cipher_raw)
+    # Kata dibaca langsung dari shared memory (view, tanpa salinan per worker)
+    shared_words_shm = shared_memory.SharedMemory(name=shm_name)
+    shared_words_b = [shared_words_shm.buf[word_offs[i]:word_offs[i + 1]] for i in range(len(word_offs) - 1)]
+    shared_word_counts = word_counts
+    # Buffer batch dialokasikan 1x: semua kandidat sepanjang run sama panjang
+    # (permutasi multiset kata yang sama), jadi offset slot ke-i tetap i * shared_pw_len
+    shared_pw_len = sum(len(w) * c for w, c in zip(shared_words_b, word_counts))
+    shared_batch_buf = (ctypes.c_ubyte * (CHECK_PER_CALL * shared_pw_len))()
+    shared_batch_addr = ctypes.addressof(shared_batch_buf)
+    shared_batch_offs = (ctypes.c_uint32 * (CHECK_PER_CALL + 1))(*[i * shared_pw_len for i in range(CHECK_PER_CALL + 1)])
+    if NUMBA_AVAIL:
+        shared_words_np = np.frombuffer(shared_words_shm.buf, dtype=np.uint8)
+        shared_woffs_np = np.array(word_offs, dtype=np.int64)
+        # Compile JIT sekarang (worker hidup sepanjang run), bukan di task pertama
+        dummy = np.zeros(1, dtype=np.int64)
+        step_perm_nb(dummy, dummy.copy(), np.zeros(1, dtype=np.uint8), shared_words_np, shared_woffs_np)
+    # Log gagal ditulis worker sendiri ke file append-only miliknya (tidak lewat pipe / main)
+    if ENABLE_FAILED_LOG:
+        shared_log_fd = os.open(f"{FILE_LOG_FAILED}.{os.getpid()}", os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+
+def write_failed(failed_list):
+    """Tulis sampel gagal ke fd log worker: 1 syscall writev (tanpa join), fallback os.write"""
+    if not failed_list or shared_log_fd is None: # fd belum dibuka (di luar worker Pool)
+        return
+    parts = []
+    for pw in failed_list:
+        parts += (pw, b"\n")
+    if hasattr(os, "writev"):
+        for i in range(0, len(parts), 1024): # IOV_MAX Linux
+            os.writev(shared_log_fd, parts[i:i + 1024])
+    else:
+        os.write(shared_log_fd, b"".join(parts))
+
+def multiset_perms(counts):
+    """Jumlah urutan unik dari multiset: n! / prod(c!) (= n! jika semua kata unik)"""
+    total = math.factorial(sum(counts))
+    for c in counts:
+        total //= math.factorial(c)
+    return total
+
+def unrank_perm(k, counts):
+    """Urutan unik ke-k (leksikografis) dari multiset kelas kata, counts[c] = jumlah kata kelas c"""
+    counts = list(counts)
+    m = sum(counts)
+    total = multiset_perms(counts)
+    perm = []
+    for _ in range(m):
+        for c in range(len(counts)):
+            if not counts[c]:
+                continue
+            sub = total * counts[c] // m # urutan sisa yang diawali kelas c
+            if k < sub:
+                perm.append(c)
+                counts[c] -= 1
+                total = sub
+                break
+            k -= sub
+        m -= 1
+    return perm
+
+def next_perm(perm):
+    """Narayana Pandita: perm -> urutan leksikografis berikutnya (in-place), return slot pertama yang berubah"""
+    i = len(perm) - 2
+    while i >= 0 and perm[i] >= perm[i + 1]:
+        i -= 1
+    if i < 0:
+        return -1
+    j = len(perm) - 1
+    while perm[j] <= perm[i]:
+        j -= 1
+    perm[i], perm[j] = perm[j], perm[i]
+    perm[i + 1:] = perm[:i:-1]
+    return i
+
+if NUMBA_AVAIL:
+    @njit(cache=True)
+    def step_perm_nb(perm, offs, buf, flat, woffs):
+        """next_perm + tulis ulang suffix buffer dalam 1 fungsi native (tanpa PyObject)"""
+        n = perm.shape[0]
+        i = n - 2
+        while i >= 0 and perm[i] >= perm[i + 1]:
+            i -= 1
+        if i < 0:
+            return -1
+        j = n - 1
+        while perm[j] <= perm[i]:
+            j -= 1
+        perm[i], perm[j] = perm[j], perm[i]
+        a, b = i + 1, n - 1
+        while a < b:
+            perm[a], perm[b] = perm[b], perm[a]
+            a += 1
+            b -= 1
+        pos = offs[i]
+        for slot in range(i, n):
+            w = perm[slot]
+            offs[slot] = pos
+            for c in range(woffs[w], woffs[w + 1]):
+                buf[pos] = flat[c]
+                pos += 1
+        return i
 
 def worker_batch_task(task_data):
-    batch_tuples, all_words = task_data
+    k_start, k_end = task_data
+    n_words = sum(shared_word_counts)
+    perm = unrank_perm(k_start, shared_word_counts) # isi perm = kelas kata (kata kembar = 1 kelas)
+    
+    # 1 buffer kerja per range, tiap kandidat di-memmove ke slot buffer batch
+    buf = bytearray(b"".join(shared_words_b[i] for i in perm))
+    offs = [0] * n_words
+    for slot in range(1, n_words):
+        offs[slot] = offs[slot - 1] + len(shared_words_b[perm[slot - 1]])
+    pass_c = (ctypes.c_char * len(buf)).from_buffer(buf)
+    if NUMBA_AVAIL:
+        perm_np = np.array(perm, dtype=np.int64)
+        offs_np = np.array(offs, dtype=np.int64)
+        buf_np = np.frombuffer(buf, dtype=np.uint8) # view, bukan salinan
+    
     checked = 0
     failed_list = [] 
+    j = 0 # kandidat yang sudah antre di buffer batch
     
-    for p_tuple in batch_tuples:
-        password_str = "".join(p_tuple)
-        pass_c = password_str.encode('utf-8')
+    for k in range(k_start, k_end):
+        if k > k_start and NUMBA_AVAIL:
+            step_perm_nb(perm_np, offs_np, buf_np, shared_words_np, shared_woffs_np)
+        elif k > k_start:
+            # Tulis ulang hanya suffix yang berubah (panjang total tetap)
+            lo = next_perm(perm)
+            pos = offs[lo]
+            for slot in range(lo, n_words):
+                w = shared_words_b[perm[slot]]
+                offs[slot] = pos
+                buf[pos:pos + len(w)] = w
+                pos += len(w)
+        
+        ctypes.memmove(shared_batch_addr + j * shared_pw_len, pass_c, shared_pw_len)
+        j += 1
+        if j < CHECK_PER_CALL and k + 1 < k_end:
+            continue
         
-        match = shared_lib.CheckPassword(pass_c, shared_salt, shared_cipher, shared_cipher_len)
-        checked += 1
+        # 1x panggilan ctypes untuk j password sekaligus (return index match / -1)
+        hit = shared_lib.CheckPasswordBatch(shared_batch_buf, shared_batch_offs, j, shared_salt, shared_cipher, shared_cipher_len)
+        k0, n_fail = k + 1 - j, (j if hit < 0 else hit)
+        checked += j if hit < 0 else hit + 1
         
-        if match == 1:
-            return (True, password_str, checked, failed_list)
+        if ENABLE_FAILED_LOG:
+            first = -(-k0 // FAILED_LOG_SAMPLE) * FAILED_LOG_SAMPLE
+            for ks in range(first, k0 + n_fail, FAILED_LOG_SAMPLE):
+                failed_list.append(ctypes.string_at(shared_batch_addr + (ks - k0) * shared_pw_len, shared_pw_len))
+        if hit >= 0:
+            password_str = ctypes.string_at(shared_batch_addr + hit * shared_pw_len, shared_pw_len).decode('utf-8')
+            write_failed(failed_list)
+            return (True, password_str, checked)
+        j = 0
+
+    write_failed(failed_list)
+    return (False, None, checked)
+
+def claim_batch(next_batch, total):
+    """Klaim range berikutnya: fetch-and-add counter batch bersama (None = semua range habis)"""
+    with next_batch.get_lock():
+        b = next_batch.value
+        next_batch.value = b + 1
+    lo = b * BATCH_SIZE
+    if lo >= total:
+        return None
+    return (lo, min(lo + BATCH_SIZE, total))
+
+def worker_loop(next_batch, total, result_q, found_flag, salt_raw, cipher_raw, shm_name, word_offs, word_counts, core_id):
+    """Worker long-lived: init 1x, lalu klaim range dari counter bersama sampai habis / ketemu"""
+    try:
+        init_worker(salt_raw, cipher_raw, shm_name, word_offs, word_counts, core_id)
+        while not found_flag.value:
+            task = claim_batch(next_batch, total)
+            if task is None:
+                break
+            res = worker_batch_task(task)
+            if res[0]:
+                found_flag.value = 1
+            result_q.put(res)
+    except Exception as e:
+        result_q.put(e)
+    result_q.put(None) # Sinyal: worker ini selesai
+
+def iter_results(result_q, total_workers):
+    """Pengganti imap_unordered: yield hasil sampai semua worker kirim sinyal selesai"""
+    done = 0
+    while done < total_workers:
+        res = result_q.get()
+        if res is None:
+            done += 1
+        elif isinstance(res, Exception):
+            raise res
         else:
-            if ENABLE_FAILED_LOG:
-                failed_list.append(password_str)
-            
-    return (False, None, checked, failed_list)
+            yield res
+
+def stop_workers(workers):
+    for p in workers:
+        p.terminate()
+    for p in workers:
+        p.join()
+
+@contextlib.contextmanager
+def start_workers(cores, total, salt_bytes, cipher_bytes, word_counts):
+    """
+    Pengganti multiprocessing.Pool: worker long-lived, salt/cipher/kata dikirim 1x saat spawn.
+    Kata unik di-flatten ke 1 SharedMemory, worker cukup tahu offset & jumlah kembar tiap kata.
+    Tidak ada antrian task (tanpa pickle / thread pengisi): range [k_start, k_end) diklaim
+    worker sendiri dari counter batch bersama di shared memory (Value + lock = fetch-and-add).
+    Worker ke-i dikunci ke cores[i] (jika PIN_CORES).
+    """
+    total_workers = len(cores)
+    words_b = [w.encode('utf-8') for w in word_counts]
+    word_offs = [0]
+    for w in words_b:
+        word_offs.append(word_offs[-1] + len(w))
+    words_shm = shared_memory.SharedMemory(create=True, size=word_offs[-1])
+    words_shm.buf[:word_offs[-1]] = b"".join(words_b)
 
-def chunked_iterable(iterable, size):
-    it = iter(iterable)
+    next_batch = multiprocessing.Value('q', 0) # index batch berikutnya (k = index * BATCH_SIZE)
+    result_q = multiprocessing.SimpleQueue()
+    found_flag = multiprocessing.Value('i', 0)
+    workers = [
+        multiprocessing.Process(
+            target=worker_loop, daemon=True,
+            args=(next_batch, total, result_q, found_flag, salt_bytes, cipher_bytes, words_shm.name, word_offs, list(word_counts.values()),
+                  core if PIN_CORES else None)
+        )
+        for core in cores
+    ]
+    try:
+        for p in workers:
+            p.start()
+        yield workers, iter_results(result_q, total_workers)
+    finally:
+        stop_workers(workers)
+        words_shm.close()
+        words_shm.unlink()
+
+def dashboard_loop(progress, progress_lock, stop_ui, total_combinations, session_start):
+    """Thread dashboard: render status tiap DASHBOARD_INTERVAL detik, lepas dari loop hasil worker"""
+    # Konstanta float dihitung 1x: tidak ada pembagian / pengurangan bignum (N!) tiap render
+    total_f = float(total_combinations)
+    inv_total_pct = 100.0 / total_f if total_f > 0 else 0.0
     while True:
-        chunk = tuple(itertools.islice(it, size))
-        if not chunk:
+        stopping = stop_ui.wait(DASHBOARD_INTERVAL)
+        with progress_lock:
+            total_checked = progress["checked"]
+
+        elapsed = time.time() - session_start
+        if elapsed < 0.1: elapsed = 0.1
+        speed = total_checked / elapsed
+        cpu_usage = psutil.cpu_percent(interval=None) if PSUTIL_AVAIL else 0.0
+
+        remaining = total_f - total_checked
+        eta = remaining / speed if speed > 0 else 0
+        percent = total_checked * inv_total_pct
+
+        if speed < 1000: speed_str = f"{int(speed)} H/s"
+        else: speed_str = f"{speed/1000:.1f} k/s"
+
+        # --- PERBAIKAN TAMPILAN DI SINI ---
+        # 1. Format String lebih pendek
+        # 2. Menggunakan padding spasi (' ' * 10) di akhir untuk menghapus sisa text lama
+        status_line = f"C:{int(cpu_usage)}% P:{percent:5.2f}% Spd:{speed_str} ETA:{format_time(eta)} Chk:{total_checked:,}"
+
+        # Tulis dengan \r di awal dan spasi kosong di akhir
+        sys.stdout.write(f"\r{status_line}          ")
+        sys.stdout.flush()
+        # ----------------------------------
+
+        if stopping:
             break
-        yield chunk
+
+def stop_dashboard(stop_ui, ui_thread):
+    """Hentikan thread dashboard (render terakhir) sebelum print pesan lain"""
+    stop_ui.set()
+    ui_thread.join()
 
 def format_time(seconds):
     if seconds < 60: return f"{seconds:.0f}s" # Hilangkan desimal biar pendek
@@ -105,7 +433,7 @@ def main():
         with open(MESSAGE_FILE, "r") as f:
             raw = base64.b64decode(f.read().strip())
         salt_bytes = raw[8:16]
-        cipher_bytes = raw[16:]
+        cipher_bytes = raw[16:16 + CIPHER_HEADER_LEN]
     except Exception as e:
         print(f"[FATAL] Message corrupt: {e}"); return
 
@@ -113,90 +441,72 @@ def main():
         words = [line.strip() for line in f if line.strip()]
     
     n_words = len(words)
-    total_combinations = math.factorial(n_words)
+    # Kata kembar: urutan yang cuma beda posisi kata kembar identik, jadi hanya urutan unik
+    word_counts = collections.Counter(words)
+    total_combinations = multiset_perms(list(word_counts.values()))
 
     print(f"[INPUT] {n_words} Kata -> {total_combinations:,} Kombinasi")
+    if len(word_counts) < n_words:
+        print(f"[INPUT] {n_words - len(word_counts)} kata kembar -> hanya urutan unik (n! / prod(c!))")
     
-    perms_gen = itertools.permutations(words)
-    tasks = ((chunk, words) for chunk in chunked_iterable(perms_gen, BATCH_SIZE))
+    # Task cuma 2 integer [k_start, k_end) per BATCH_SIZE, diklaim worker dari counter
+    # bersama & permutasi di-unrank di worker (main tidak membangkitkan task sama sekali)
 
     # 2. WORKER SETUP
-    total_workers = multiprocessing.cpu_count()
+    cores = physical_cores()
+    total_workers = len(cores)
     print("-" * 60)
-    print(f"[ENGINE] Workers : {total_workers}")
+    print(f"[ENGINE] Workers : {total_workers} (Core Fisik{', Pinned' if PIN_CORES else ''})")
     print("-" * 60)
     time.sleep(1)
 
     # 3. EXECUTION
     start_time = time.time()
-    total_checked = 0
     session_start = time.time()
+    # total_checked dibagi dengan thread dashboard (dibaca tiap DASHBOARD_INTERVAL)
+    progress = {"checked": 0}
+    progress_lock = threading.Lock()
+    stop_ui = threading.Event()
+    ui_thread = threading.Thread(target=dashboard_loop, args=(progress, progress_lock, stop_ui, total_combinations, session_start), daemon=True)
 
-    log_file_handle = None
-    if ENABLE_FAILED_LOG:
-        log_file_handle = open(FILE_LOG_FAILED, "a", buffering=1024*1024)
+    with start_workers(cores, total_combinations, salt_bytes, cipher_bytes, word_counts) as (workers, result_iterator):
+        ui_thread.start()
 
-    try:
-        with multiprocessing.Pool(processes=total_workers, initializer=init_worker, initargs=(salt_bytes, cipher_bytes)) as pool:
-            
-            result_iterator = pool.imap_unordered(worker_batch_task, tasks)
-            
-            while True:
-                try:
-                    # Update Dashboard Logic
-                    elapsed = time.time() - session_start
-                    if elapsed < 0.1: elapsed = 0.1
-                    speed = total_checked / elapsed
-                    cpu_usage = psutil.cpu_percent(interval=None) if PSUTIL_AVAIL else 0.0
-                    
-                    remaining = total_combinations - total_checked
-                    eta = remaining / speed if speed > 0 else 0
-                    percent = (total_checked / total_combinations) * 100 if total_combinations > 0 else 0
-                    
-                    if speed < 1000: speed_str = f"{int(speed)} H/s"
-                    else: speed_str = f"{speed/1000:.1f} k/s"
-
-                    # --- PERBAIKAN TAMPILAN DI SINI ---
-                    # 1. Format String lebih pendek
-                    # 2. Menggunakan padding spasi (' ' * 10) di akhir untuk menghapus sisa text lama
-                    status_line = f"C:{int(cpu_usage)}% P:{percent:5.2f}% Spd:{speed_str} ETA:{format_time(eta)} Chk:{total_checked:,}"
-                    
-                    # Tulis dengan \r di awal dan spasi kosong di akhir
-                    sys.stdout.write(f"\r{status_line}          ")
-                    sys.stdout.flush()
-                    # ----------------------------------
-
-                    # BLOCKING WAIT
-                    res = next(result_iterator) 
-                    is_found, pw, count, failed_data = res
-                    
-                    total_checked += count
-
-                    if ENABLE_FAILED_LOG and failed_data and log_file_handle:
-                        log_chunk = "\n".join(failed_data) + "\n"
-                        log_file_handle.write(log_chunk)
-                    
-                    if is_found:
-                        print(f"\n\n[🔥 MATCH FOUND 🔥] {pw}")
-                        with open(FILE_LOG_SUCCESS, "w") as f: f.write(pw)
-                        pool.terminate()
-                        break
-
-                except StopIteration:
+        while True:
+            try:
+                # BLOCKING WAIT (dashboard jalan di thread sendiri)
+                res = next(result_iterator) 
+                is_found, pw, count = res
+
+                with progress_lock:
+                    progress["checked"] += count
+
+                if is_found:
+                    stop_dashboard(stop_ui, ui_thread)
+                    print(f"\n\n[🔥 MATCH FOUND 🔥] {pw}")
+                    with open(FILE_LOG_SUCCESS, "w") as f: f.write(pw)
+                    stop_workers(workers)
                     break
-                except KeyboardInterrupt:
-                    pool.terminate()
-                    print("\n[STOP]"); break
-                except Exception as e:
-                    pool.terminate()
-                    print(f"\n[ERROR] {e}"); break
-    finally:
-        if log_file_handle:
-            log_file_handle.close()
+
+            except StopIteration:
+                stop_dashboard(stop_ui, ui_thread)
+                break
+            except KeyboardInterrupt:
+                stop_workers(workers)
+                stop_dashboard(stop_ui, ui_thread)
+                print("\n[STOP]"); break
+            except Exception as e:
+                stop_workers(workers)
+                stop_dashboard(stop_ui, ui_thread)
+                print(f"\n[ERROR] {e}"); break
 
     print("\n" + "="*60)
     print("SELESAI.")
 
 if __name__ == "__main__":
     multiprocessing.freeze_support()
+    # fork (Linux): worker mewarisi data parent copy-on-write, args tidak di-pickle ulang.
+    # Python 3.14+ default ke forkserver di Linux, jadi dipaksa di sini.
+    if "fork" in multiprocessing.get_all_start_methods():
+        multiprocessing.set_start_method("fork", force=True)
     main()
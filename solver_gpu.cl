@@ -0,0 +1,337 @@
+// =============================================================================
+// SOLVER GPU KERNEL (OpenCL) - 1 work-item = 1 kandidat password
+// =============================================================================
+// Port 1:1 dari checkCore di crypto_engine_universal.go:
+//   1. SHA-512 x11513 (raw bytes)   2. hex string (128 char)
+//   3. MD5 chain: 9 blok x (MD5(prev || hex || salt) + 9999x MD5 16 byte) -> key 128 / IV 16
+//   4. AES custom 38 round (nk=32) CBC decrypt header (<= 96 byte) -> cari pola JSON
+// Hasil: index kandidat terkecil yang match ditulis ke *found (atomic_min), host
+// isi *found = n sebelum enqueue. Layout SoA: kandidat ke-i = pw_buf[i * pw_len ..], semua
+// kandidat sebatch sepanjang pw_len (permutasi kata yang sama).
+// Spesialisasi runtime (opsional, host build dengan -D): PW_LEN, CIPHER_LEN, SALT_INIT
+// (8 byte salt dipisah koma) -> argumen kernel diganti konstanta, loop padding SHA-512 &
+// loop header AES terurai penuh oleh compiler. HEADER_PREFILTER=1 menyalakan tolak-blok-0
+// (default mati, sama dengan jalur Go).
+
+#ifndef HEADER_PREFILTER
+#define HEADER_PREFILTER 0
+#endif
+#ifndef ITER_SHA
+#define ITER_SHA 11513
+#endif
+#ifndef ITER_MD5
+#define ITER_MD5 10000
+#endif
+
+#define ROTR64(x, n) rotate((ulong)(x), (ulong)(64 - (n)))
+#define ROTL32(x, n) rotate((uint)(x), (uint)(n))
+
+__constant ulong K512[80] = {
+	0x428a2f98d728ae22UL, 0x7137449123ef65cdUL, 0xb5c0fbcfec4d3b2fUL, 0xe9b5dba58189dbbcUL,
+	0x3956c25bf348b538UL, 0x59f111f1b605d019UL, 0x923f82a4af194f9bUL, 0xab1c5ed5da6d8118UL,
+	0xd807aa98a3030242UL, 0x12835b0145706fbeUL, 0x243185be4ee4b28cUL, 0x550c7dc3d5ffb4e2UL,
+	0x72be5d74f27b896fUL, 0x80deb1fe3b1696b1UL, 0x9bdc06a725c71235UL, 0xc19bf174cf692694UL,
+	0xe49b69c19ef14ad2UL, 0xefbe4786384f25e3UL, 0x0fc19dc68b8cd5b5UL, 0x240ca1cc77ac9c65UL,
+	0x2de92c6f592b0275UL, 0x4a7484aa6ea6e483UL, 0x5cb0a9dcbd41fbd4UL, 0x76f988da831153b5UL,
+	0x983e5152ee66dfabUL, 0xa831c66d2db43210UL, 0xb00327c898fb213fUL, 0xbf597fc7beef0ee4UL,
+	0xc6e00bf33da88fc2UL, 0xd5a79147930aa725UL, 0x06ca6351e003826fUL, 0x142929670a0e6e70UL,
+	0x27b70a8546d22ffcUL, 0x2e1b21385c26c926UL, 0x4d2c6dfc5ac42aedUL, 0x53380d139d95b3dfUL,
+	0x650a73548baf63deUL, 0x766a0abb3c77b2a8UL, 0x81c2c92e47edaee6UL, 0x92722c851482353bUL,
+	0xa2bfe8a14cf10364UL, 0xa81a664bbc423001UL, 0xc24b8b70d0f89791UL, 0xc76c51a30654be30UL,
+	0xd192e819d6ef5218UL, 0xd69906245565a910UL, 0xf40e35855771202aUL, 0x106aa07032bbd1b8UL,
+	0x19a4c116b8d2d0c8UL, 0x1e376c085141ab53UL, 0x2748774cdf8eeb99UL, 0x34b0bcb5e19b48a8UL,
+	0x391c0cb3c5c95a63UL, 0x4ed8aa4ae3418acbUL, 0x5b9cca4f7763e373UL, 0x682e6ff3d6b2b8a3UL,
+	0x748f82ee5defb2fcUL, 0x78a5636f43172f60UL, 0x84c87814a1f0ab72UL, 0x8cc702081a6439ecUL,
+	0x90befffa23631e28UL, 0xa4506cebde82bde9UL, 0xbef9a3f7b2c67915UL, 0xc67178f2e372532bUL,
+	0xca273eceea26619cUL, 0xd186b8c721c0c207UL, 0xeada7dd6cde0eb1eUL, 0xf57d4f7fee6ed178UL,
+	0x06f067aa72176fbaUL, 0x0a637dc5a2c898a6UL, 0x113f9804bef90daeUL, 0x1b710b35131c471bUL,
+	0x28db77f523047d84UL, 0x32caab7b40c72493UL, 0x3c9ebe0a15c9bebcUL, 0x431d67c49c100d4cUL,
+	0x4cc5d4becb3e42b6UL, 0x597f299cfc657e2aUL, 0x5fcb6fab3ad6faecUL, 0x6c44198c4a475817UL,
+};
+__constant uint K5[64] = {
+	0xd76aa478, 0xe8c7b756, 0x242070db, 0xc1bdceee, 0xf57c0faf, 0x4787c62a, 0xa8304613, 0xfd469501,
+	0x698098d8, 0x8b44f7af, 0xffff5bb1, 0x895cd7be, 0x6b901122, 0xfd987193, 0xa679438e, 0x49b40821,
+	0xf61e2562, 0xc040b340, 0x265e5a51, 0xe9b6c7aa, 0xd62f105d, 0x02441453, 0xd8a1e681, 0xe7d3fbc8,
+	0x21e1cde6, 0xc33707d6, 0xf4d50d87, 0x455a14ed, 0xa9e3e905, 0xfcefa3f8, 0x676f02d9, 0x8d2a4c8a,
+	0xfffa3942, 0x8771f681, 0x6d9d6122, 0xfde5380c, 0xa4beea44, 0x4bdecfa9, 0xf6bb4b60, 0xbebfbc70,
+	0x289b7ec6, 0xeaa127fa, 0xd4ef3085, 0x04881d05, 0xd9d4d039, 0xe6db99e5, 0x1fa27cf8, 0xc4ac5665,
+	0xf4292244, 0x432aff97, 0xab9423a7, 0xfc93a039, 0x655b59c3, 0x8f0ccc92, 0xffeff47d, 0x85845dd1,
+	0x6fa87e4f, 0xfe2ce6e0, 0xa3014314, 0x4e0811a1, 0xf7537e82, 0xbd3af235, 0x2ad7d2bb, 0xeb86d391,
+};
+__constant uchar SBOX[256] = {
+	0x63, 0x7c, 0x77, 0x7b, 0xf2, 0x6b, 0x6f, 0xc5, 0x30, 0x01, 0x67, 0x2b, 0xfe, 0xd7, 0xab, 0x76,
+	0xca, 0x82, 0xc9, 0x7d, 0xfa, 0x59, 0x47, 0xf0, 0xad, 0xd4, 0xa2, 0xaf, 0x9c, 0xa4, 0x72, 0xc0,
+	0xb7, 0xfd, 0x93, 0x26, 0x36, 0x3f, 0xf7, 0xcc, 0x34, 0xa5, 0xe5, 0xf1, 0x71, 0xd8, 0x31, 0x15,
+	0x04, 0xc7, 0x23, 0xc3, 0x18, 0x96, 0x05, 0x9a, 0x07, 0x12, 0x80, 0xe2, 0xeb, 0x27, 0xb2, 0x75,
+	0x09, 0x83, 0x2c, 0x1a, 0x1b, 0x6e, 0x5a, 0xa0, 0x52, 0x3b, 0xd6, 0xb3, 0x29, 0xe3, 0x2f, 0x84,
+	0x53, 0xd1, 0x00, 0xed, 0x20, 0xfc, 0xb1, 0x5b, 0x6a, 0xcb, 0xbe, 0x39, 0x4a, 0x4c, 0x58, 0xcf,
+	0xd0, 0xef, 0xaa, 0xfb, 0x43, 0x4d, 0x33, 0x85, 0x45, 0xf9, 0x02, 0x7f, 0x50, 0x3c, 0x9f, 0xa8,
+	0x51, 0xa3, 0x40, 0x8f, 0x92, 0x9d, 0x38, 0xf5, 0xbc, 0xb6, 0xda, 0x21, 0x10, 0xff, 0xf3, 0xd2,
+	0xcd, 0x0c, 0x13, 0xec, 0x5f, 0x97, 0x44, 0x17, 0xc4, 0xa7, 0x7e, 0x3d, 0x64, 0x5d, 0x19, 0x73,
+	0x60, 0x81, 0x4f, 0xdc, 0x22, 0x2a, 0x90, 0x88, 0x46, 0xee, 0xb8, 0x14, 0xde, 0x5e, 0x0b, 0xdb,
+	0xe0, 0x32, 0x3a, 0x0a, 0x49, 0x06, 0x24, 0x5c, 0xc2, 0xd3, 0xac, 0x62, 0x91, 0x95, 0xe4, 0x79,
+	0xe7, 0xc8, 0x37, 0x6d, 0x8d, 0xd5, 0x4e, 0xa9, 0x6c, 0x56, 0xf4, 0xea, 0x65, 0x7a, 0xae, 0x08,
+	0xba, 0x78, 0x25, 0x2e, 0x1c, 0xa6, 0xb4, 0xc6, 0xe8, 0xdd, 0x74, 0x1f, 0x4b, 0xbd, 0x8b, 0x8a,
+	0x70, 0x3e, 0xb5, 0x66, 0x48, 0x03, 0xf6, 0x0e, 0x61, 0x35, 0x57, 0xb9, 0x86, 0xc1, 0x1d, 0x9e,
+	0xe1, 0xf8, 0x98, 0x11, 0x69, 0xd9, 0x8e, 0x94, 0x9b, 0x1e, 0x87, 0xe9, 0xce, 0x55, 0x28, 0xdf,
+	0x8c, 0xa1, 0x89, 0x0d, 0xbf, 0xe6, 0x42, 0x68, 0x41, 0x99, 0x2d, 0x0f, 0xb0, 0x54, 0xbb, 0x16,
+};
+__constant uchar RSBOX[256] = {
+	0x52, 0x09, 0x6a, 0xd5, 0x30, 0x36, 0xa5, 0x38, 0xbf, 0x40, 0xa3, 0x9e, 0x81, 0xf3, 0xd7, 0xfb,
+	0x7c, 0xe3, 0x39, 0x82, 0x9b, 0x2f, 0xff, 0x87, 0x34, 0x8e, 0x43, 0x44, 0xc4, 0xde, 0xe9, 0xcb,
+	0x54, 0x7b, 0x94, 0x32, 0xa6, 0xc2, 0x23, 0x3d, 0xee, 0x4c, 0x95, 0x0b, 0x42, 0xfa, 0xc3, 0x4e,
+	0x08, 0x2e, 0xa1, 0x66, 0x28, 0xd9, 0x24, 0xb2, 0x76, 0x5b, 0xa2, 0x49, 0x6d, 0x8b, 0xd1, 0x25,
+	0x72, 0xf8, 0xf6, 0x64, 0x86, 0x68, 0x98, 0x16, 0xd4, 0xa4, 0x5c, 0xcc, 0x5d, 0x65, 0xb6, 0x92,
+	0x6c, 0x70, 0x48, 0x50, 0xfd, 0xed, 0xb9, 0xda, 0x5e, 0x15, 0x46, 0x57, 0xa7, 0x8d, 0x9d, 0x84,
+	0x90, 0xd8, 0xab, 0x00, 0x8c, 0xbc, 0xd3, 0x0a, 0xf7, 0xe4, 0x58, 0x05, 0xb8, 0xb3, 0x45, 0x06,
+	0xd0, 0x2c, 0x1e, 0x8f, 0xca, 0x3f, 0x0f, 0x02, 0xc1, 0xaf, 0xbd, 0x03, 0x01, 0x13, 0x8a, 0x6b,
+	0x3a, 0x91, 0x11, 0x41, 0x4f, 0x67, 0xdc, 0xea, 0x97, 0xf2, 0xcf, 0xce, 0xf0, 0xb4, 0xe6, 0x73,
+	0x96, 0xac, 0x74, 0x22, 0xe7, 0xad, 0x35, 0x85, 0xe2, 0xf9, 0x37, 0xe8, 0x1c, 0x75, 0xdf, 0x6e,
+	0x47, 0xf1, 0x1a, 0x71, 0x1d, 0x29, 0xc5, 0x89, 0x6f, 0xb7, 0x62, 0x0e, 0xaa, 0x18, 0xbe, 0x1b,
+	0xfc, 0x56, 0x3e, 0x4b, 0xc6, 0xd2, 0x79, 0x20, 0x9a, 0xdb, 0xc0, 0xfe, 0x78, 0xcd, 0x5a, 0xf4,
+	0x1f, 0xdd, 0xa8, 0x33, 0x88, 0x07, 0xc7, 0x31, 0xb1, 0x12, 0x10, 0x59, 0x27, 0x80, 0xec, 0x5f,
+	0x60, 0x51, 0x7f, 0xa9, 0x19, 0xb5, 0x4a, 0x0d, 0x2d, 0xe5, 0x7a, 0x9f, 0x93, 0xc9, 0x9c, 0xef,
+	0xa0, 0xe0, 0x3b, 0x4d, 0xae, 0x2a, 0xf5, 0xb0, 0xc8, 0xeb, 0xbb, 0x3c, 0x83, 0x53, 0x99, 0x61,
+	0x17, 0x2b, 0x04, 0x7e, 0xba, 0x77, 0xd6, 0x26, 0xe1, 0x69, 0x14, 0x63, 0x55, 0x21, 0x0c, 0x7d,
+};
+
+__constant uchar MD5_S[64] = {
+	7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+	5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
+	4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+	6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21,
+};
+__constant uchar RCON[5] = { 0x8d, 0x01, 0x02, 0x04, 0x08 }; // (i/nk) cuma sampai 4 (156 word, nk=32)
+
+// -----------------------------------------------------------------------------
+// SHA-512
+// -----------------------------------------------------------------------------
+__constant ulong SHA512_IV[8] = {
+	0x6a09e667f3bcc908UL, 0xbb67ae8584caa73bUL, 0x3c6ef372fe94f82bUL, 0xa54ff53a5f1d36f1UL,
+	0x510e527fade682d1UL, 0x9b05688c2b3e6c1fUL, 0x1f83d9abfb41bd6bUL, 0x5be0cd19137e2179UL,
+};
+
+// h += compress(w); w (16 word big-endian) dipakai sebagai ring message schedule
+void sha512_compress(ulong *h, ulong *w) {
+	ulong a = h[0], b = h[1], c = h[2], d = h[3], e = h[4], f = h[5], g = h[6], hh = h[7];
+	for (int t = 0; t < 80; t++) {
+		ulong wt;
+		if (t < 16) wt = w[t];
+		else {
+			ulong w15 = w[(t - 15) & 15], w2 = w[(t - 2) & 15];
+			ulong s0 = ROTR64(w15, 1) ^ ROTR64(w15, 8) ^ (w15 >> 7);
+			ulong s1 = ROTR64(w2, 19) ^ ROTR64(w2, 61) ^ (w2 >> 6);
+			wt = w[t & 15] = w[t & 15] + s0 + w[(t - 7) & 15] + s1;
+		}
+		ulong t1 = hh + (ROTR64(e, 14) ^ ROTR64(e, 18) ^ ROTR64(e, 41)) + (g ^ (e & (f ^ g))) + K512[t] + wt;
+		ulong t2 = (ROTR64(a, 28) ^ ROTR64(a, 34) ^ ROTR64(a, 39)) + ((a & b) | (c & (a | b)));
+		hh = g; g = f; f = e; e = d + t1; d = c; c = b; b = a; a = t1 + t2;
+	}
+	h[0] += a; h[1] += b; h[2] += c; h[3] += d; h[4] += e; h[5] += f; h[6] += g; h[7] += hh;
+}
+
+// SHA-512 password (panjang bebas, dibaca langsung dari global) lalu 11512x atas digest 64 byte
+void sha512_chain(__global const uchar *pw, uint len, ulong *h) {
+	ulong w[16];
+	for (int i = 0; i < 8; i++) h[i] = SHA512_IV[i];
+	uint padded = (len + 17 + 127) & ~127u;
+	for (uint blk = 0; blk < padded; blk += 128) {
+		for (int j = 0; j < 16; j++) {
+			ulong v = 0;
+			for (int k = 0; k < 8; k++) {
+				uint p = blk + 8 * j + k;
+				uchar b = 0;
+				if (p < len) b = pw[p];
+				else if (p == len) b = 0x80;
+				else if (p >= padded - 8) b = (uchar)(((ulong)len * 8) >> (8 * (padded - 1 - p)));
+				v = (v << 8) | b;
+			}
+			w[j] = v;
+		}
+		sha512_compress(h, w);
+	}
+	// Input 64 byte = 1 blok dengan padding tetap (0x80.., panjang 512 bit)
+	for (int it = 1; it < ITER_SHA; it++) {
+		for (int j = 0; j < 8; j++) { w[j] = h[j]; h[j] = SHA512_IV[j]; }
+		w[8] = 0x8000000000000000UL;
+		for (int j = 9; j < 15; j++) w[j] = 0;
+		w[15] = 512;
+		sha512_compress(h, w);
+	}
+}
+
+// -----------------------------------------------------------------------------
+// MD5
+// -----------------------------------------------------------------------------
+void md5_compress(uint *st, const uint *m) {
+	uint a = st[0], b = st[1], c = st[2], d = st[3];
+	for (int i = 0; i < 64; i++) {
+		uint f, g;
+		if (i < 16)      { f = d ^ (b & (c ^ d)); g = i; }
+		else if (i < 32) { f = c ^ (d & (b ^ c)); g = (5 * i + 1) & 15; }
+		else if (i < 48) { f = b ^ c ^ d;         g = (3 * i + 5) & 15; }
+		else             { f = c ^ (b | ~d);      g = (7 * i) & 15; }
+		uint tmp = d; d = c; c = b;
+		b = b + ROTL32(a + f + K5[i] + m[g], MD5_S[i]);
+		a = tmp;
+	}
+	st[0] += a; st[1] += b; st[2] += c; st[3] += d;
+}
+
+// 9 blok KDF: gen[144] = key (128) || IV (16)
+void md5_kdf(const uchar *hexs, const uchar *salt, uchar *gen) {
+	uchar msg[192]; // prev 16 + hex 128 + salt 8 = 152 (+ padding -> 3 blok)
+	uint m[16], st[4];
+	for (int blk = 0; blk < 9; blk++) {
+		int len = 0;
+		if (blk > 0) for (int i = 0; i < 16; i++) msg[len++] = gen[16 * (blk - 1) + i];
+		for (int i = 0; i < 128; i++) msg[len++] = hexs[i];
+		for (int i = 0; i < 8; i++) msg[len++] = salt[i];
+		ulong bits = (ulong)len * 8;
+		msg[len] = 0x80;
+		for (int i = len + 1; i < 184; i++) msg[i] = 0;
+		for (int i = 0; i < 8; i++) msg[184 + i] = (uchar)(bits >> (8 * i));
+		st[0] = 0x67452301; st[1] = 0xefcdab89; st[2] = 0x98badcfe; st[3] = 0x10325476;
+		for (int off = 0; off < 192; off += 64) {
+			for (int j = 0; j < 16; j++)
+				m[j] = msg[off + 4*j] | (msg[off + 4*j + 1] << 8) | (msg[off + 4*j + 2] << 16) | ((uint)msg[off + 4*j + 3] << 24);
+			md5_compress(st, m);
+		}
+		// 9999x MD5 atas digest 16 byte: 1 blok, padding tetap (0x80, panjang 128 bit)
+		for (int it = 1; it < ITER_MD5; it++) {
+			for (int j = 0; j < 4; j++) m[j] = st[j];
+			m[4] = 0x80;
+			for (int j = 5; j < 14; j++) m[j] = 0;
+			m[14] = 128; m[15] = 0;
+			st[0] = 0x67452301; st[1] = 0xefcdab89; st[2] = 0x98badcfe; st[3] = 0x10325476;
+			md5_compress(st, m);
+		}
+		for (int j = 0; j < 16; j++) gen[16 * blk + j] = (uchar)(st[j >> 2] >> (8 * (j & 3)));
+	}
+}
+
+// -----------------------------------------------------------------------------
+// AES custom (38 round, nk=32) - urutan byte AES standar (ColMajor + ShiftRight)
+// -----------------------------------------------------------------------------
+#define AES_ROUNDS 38
+#define AES_NK 32
+#define AES_KS_WORDS (4 * (AES_ROUNDS + 1))
+#define RK_BYTE(rk, i) ((uchar)((rk)[(i) >> 2] >> (24 - 8 * ((i) & 3))))
+
+uchar xtime(uchar x) { return (uchar)((x << 1) ^ (((x >> 7) & 1) * 0x1b)); }
+uchar gmul(uchar x, uchar y) {
+	uchar r = 0;
+	for (int i = 0; i < 4; i++) { if (y & 1) r ^= x; x = xtime(x); y >>= 1; }
+	return r;
+}
+
+void aes_key_expansion(const uchar *key, uint *rk) {
+	for (int i = 0; i < AES_NK; i++)
+		rk[i] = ((uint)key[4*i] << 24) | ((uint)key[4*i + 1] << 16) | ((uint)key[4*i + 2] << 8) | key[4*i + 3];
+	for (int i = AES_NK; i < AES_KS_WORDS; i++) {
+		uint t = rk[i - 1];
+		if (i % AES_NK == 0) {
+			t = (t << 8) | (t >> 24);
+			t = ((uint)SBOX[t >> 24] << 24) | ((uint)SBOX[(t >> 16) & 0xff] << 16) | ((uint)SBOX[(t >> 8) & 0xff] << 8) | SBOX[t & 0xff];
+			t ^= (uint)RCON[i / AES_NK] << 24;
+		} else if (i % AES_NK == 4) {
+			t = ((uint)SBOX[t >> 24] << 24) | ((uint)SBOX[(t >> 16) & 0xff] << 16) | ((uint)SBOX[(t >> 8) & 0xff] << 8) | SBOX[t & 0xff];
+		}
+		rk[i] = rk[i - AES_NK] ^ t;
+	}
+}
+
+void aes_inv_cipher(uchar *s, const uint *rk) {
+	uchar t[16];
+	for (int i = 0; i < 16; i++) s[i] ^= RK_BYTE(rk, 16 * AES_ROUNDS + i);
+	for (int round = AES_ROUNDS - 1; round >= 0; round--) {
+		// InvShiftRows + InvSubBytes: baris r geser kanan r (state[r][c] = s[4c + r])
+		for (int c = 0; c < 4; c++)
+			for (int r = 0; r < 4; r++)
+				t[4 * c + r] = RSBOX[s[4 * ((c - r + 4) & 3) + r]];
+		for (int i = 0; i < 16; i++) s[i] = t[i] ^ RK_BYTE(rk, 16 * round + i);
+		if (round == 0) break;
+		for (int c = 0; c < 4; c++) {
+			uchar a = s[4*c], b = s[4*c + 1], cv = s[4*c + 2], d = s[4*c + 3];
+			s[4*c]     = gmul(a, 0x0e) ^ gmul(b, 0x0b) ^ gmul(cv, 0x0d) ^ gmul(d, 0x09);
+			s[4*c + 1] = gmul(a, 0x09) ^ gmul(b, 0x0e) ^ gmul(cv, 0x0b) ^ gmul(d, 0x0d);
+			s[4*c + 2] = gmul(a, 0x0d) ^ gmul(b, 0x09) ^ gmul(cv, 0x0e) ^ gmul(d, 0x0b);
+			s[4*c + 3] = gmul(a, 0x0b) ^ gmul(b, 0x0d) ^ gmul(cv, 0x09) ^ gmul(d, 0x0e);
+		}
+	}
+}
+
+// -----------------------------------------------------------------------------
+// PATTERN CHECK
+// -----------------------------------------------------------------------------
+__constant uchar PAT_ID[5] = { '"', 'i', 'd', '"', ':' };
+__constant uchar PAT_VER[11] = { '"', 'v', 'e', 'r', 's', 'i', 'o', 'n', '"', ':', '3' };
+__constant uchar PAT_KTY[5] = { '"', 'k', 't', 'y', '"' };
+
+// XOR-OR accumulator tanpa early-exit (sama dengan hasHeaderPattern di Go): kerja
+// konstan per work-item, tidak ada divergensi branch antar kandidat dalam 1 warp
+uint contains(const uchar *buf, int len, __constant uchar *pat, int plen) {
+	uint hit = 0;
+	for (int i = 0; i + plen <= len; i++) {
+		uchar d = 0;
+		for (int j = 0; j < plen; j++) d |= buf[i + j] ^ pat[j];
+		hit |= d == 0;
+	}
+	return hit;
+}
+
+// Sama dengan headerPlausible di Go: blok 0 plaintext asli = teks (byte kontrol / DEL = bukan
+// teks; byte >= 0x80 lolos untuk BOM & UTF-8 non-ASCII)
+int plausible(const uchar *b) {
+	uchar bad = 0;
+	for (int i = 0; i < 16; i++) bad |= (b[i] < 0x20 && b[i] != '\t' && b[i] != '\n' && b[i] != '\r') | (b[i] == 0x7f);
+	return !bad;
+}
+
+__kernel void check_candidates(__global const uchar *pw_buf, uint pw_len, int n,
+                               __global const uchar *salt, __global const uchar *cipher, int cipher_len,
+                               __global volatile int *found) {
+	int gid = get_global_id(0);
+	if (gid >= n) return;
+
+	ulong h[8];
+#ifdef PW_LEN
+	pw_len = PW_LEN;
+#endif
+#ifdef CIPHER_LEN
+	cipher_len = CIPHER_LEN;
+#endif
+	uchar sl[8];
+#ifdef SALT_INIT
+	const uchar salt_c[8] = {SALT_INIT};
+	for (int i = 0; i < 8; i++) sl[i] = salt_c[i];
+#else
+	for (int i = 0; i < 8; i++) sl[i] = salt[i];
+#endif
+
+	sha512_chain(pw_buf + (size_t)gid * pw_len, pw_len, h);
+	uchar hexs[128];
+	for (int i = 0; i < 64; i++) {
+		uchar b = (uchar)(h[i >> 3] >> (56 - 8 * (i & 7)));
+		uchar hi = b >> 4, lo = b & 15;
+		hexs[2 * i] = hi < 10 ? '0' + hi : 'a' + hi - 10;
+		hexs[2 * i + 1] = lo < 10 ? '0' + lo : 'a' + lo - 10;
+	}
+	uchar gen[144];
+	md5_kdf(hexs, sl, gen);
+
+	uint rk[AES_KS_WORDS];
+	aes_key_expansion(gen, rk);
+	int limit = cipher_len > 96 ? 96 : cipher_len;
+	limit -= limit % 16;
+	uchar pt[96];
+	for (int off = 0; off < limit; off += 16) {
+		uchar s[16];
+		for (int i = 0; i < 16; i++) s[i] = cipher[off + i];
+		aes_inv_cipher(s, rk);
+		for (int i = 0; i < 16; i++) pt[off + i] = s[i] ^ (off ? cipher[off - 16 + i] : gen[128 + i]);
+		if (HEADER_PREFILTER && off == 0 && !plausible(pt)) return; // key salah: 5 blok sisanya tidak didekripsi
+	}
+	if (contains(pt, limit, PAT_ID, 5) | contains(pt, limit, PAT_VER, 11) | contains(pt, limit, PAT_KTY, 5))
+		atomic_min(found, gid);
+}
@@ -19,6 +19,263 @@ typedef struct { const char *p; ptrdiff_t n; } _GoString_;
 /* Start of preamble from import "C" comments.  */
 
 
+#line 3 "crypto_engine_universal.go"
+
+#include <stdint.h>
+#include <string.h>
+
+// =============================================================================
+// HARDWARE AES (AES-NI x86 / ARMv8 Crypto Extension)
+// =============================================================================
+// Cipher di sini bukan AES standar (38 round, key 1024-bit), jadi crypto/aes
+// tidak bisa dipakai. Tapi 1 round-nya identik dengan round AES biasa, jadi
+// instruksi AESDEC/AESD tetap bisa dipakai dengan round key custom
+// (Equivalent Inverse Cipher: round key tengah di-InvMixColumns dulu).
+#if defined(__x86_64__) || defined(__i386__)
+#include <cpuid.h>
+#include <wmmintrin.h>
+#define SOLVER_AES_X86 1
+#elif defined(__aarch64__) && (defined(__ARM_FEATURE_CRYPTO) || defined(__ARM_FEATURE_AES))
+#include <arm_neon.h>
+#include <sys/auxv.h>
+#include <asm/hwcap.h>
+#define SOLVER_AES_ARM 1
+#endif
+
+// Build `go build -tags aesni ...`: AES-NI dianggap pasti ada (seperti make AESNI=1),
+// cek hwAES di hot path hilang saat compile (lihat aesForced). CPUID tetap dicek 1x
+// saat load supaya CPU tanpa AES-NI gagal dengan pesan jelas, bukan SIGILL.
+
+#ifndef SOLVER_AESNI
+#define SOLVER_AESNI 0
+#endif
+#if SOLVER_AESNI && !defined(SOLVER_AES_X86)
+#error "-tags aesni hanya untuk x86 (AES-NI)"
+#endif
+
+static int solver_cpu_has_aes(void) {
+#if defined(SOLVER_AES_X86)
+	unsigned int a, b, c, d;
+	if (!__get_cpuid(1, &a, &b, &c, &d)) return 0;
+	return (c & bit_AES) != 0;
+#elif defined(SOLVER_AES_ARM)
+	return (getauxval(AT_HWCAP) & HWCAP_AES) != 0;
+#else
+	return 0;
+#endif
+}
+
+#if defined(SOLVER_AES_X86)
+// dk[r] = InvMixColumns(rk[r]) untuk round 1..rounds-1, dk[0]/dk[rounds] = apa adanya
+__attribute__((target("aes,sse2")))
+static void solver_aes_prepare_dec(const uint8_t *rk, int rounds, uint8_t *dk) {
+	_mm_storeu_si128((__m128i *)dk, _mm_loadu_si128((const __m128i *)rk));
+	for (int r = 1; r < rounds; r++)
+		_mm_storeu_si128((__m128i *)(dk + 16*r), _mm_aesimc_si128(_mm_loadu_si128((const __m128i *)(rk + 16*r))));
+	_mm_storeu_si128((__m128i *)(dk + 16*rounds), _mm_loadu_si128((const __m128i *)(rk + 16*rounds)));
+}
+
+__attribute__((target("aes,sse2")))
+static void solver_aes_dec_cbc(const uint8_t *dk, int rounds, const uint8_t *iv, const uint8_t *in, uint8_t *out, int nblocks) {
+	__m128i prev = _mm_loadu_si128((const __m128i *)iv);
+	for (int b = 0; b < nblocks; b++) {
+		__m128i c = _mm_loadu_si128((const __m128i *)(in + 16*b));
+		__m128i s = _mm_xor_si128(c, _mm_loadu_si128((const __m128i *)(dk + 16*rounds)));
+		for (int r = rounds - 1; r > 0; r--)
+			s = _mm_aesdec_si128(s, _mm_loadu_si128((const __m128i *)(dk + 16*r)));
+		s = _mm_aesdeclast_si128(s, _mm_loadu_si128((const __m128i *)dk));
+		_mm_storeu_si128((__m128i *)(out + 16*b), _mm_xor_si128(s, prev));
+		prev = c;
+	}
+}
+#elif defined(SOLVER_AES_ARM)
+static void solver_aes_prepare_dec(const uint8_t *rk, int rounds, uint8_t *dk) {
+	vst1q_u8(dk, vld1q_u8(rk));
+	for (int r = 1; r < rounds; r++) vst1q_u8(dk + 16*r, vaesimcq_u8(vld1q_u8(rk + 16*r)));
+	vst1q_u8(dk + 16*rounds, vld1q_u8(rk + 16*rounds));
+}
+
+// AESD = AddRoundKey + InvShiftRows + InvSubBytes, AESIMC = InvMixColumns
+static void solver_aes_dec_cbc(const uint8_t *dk, int rounds, const uint8_t *iv, const uint8_t *in, uint8_t *out, int nblocks) {
+	uint8x16_t prev = vld1q_u8(iv);
+	for (int b = 0; b < nblocks; b++) {
+		uint8x16_t c = vld1q_u8(in + 16*b);
+		uint8x16_t s = c;
+		for (int r = rounds; r > 1; r--) s = vaesimcq_u8(vaesdq_u8(s, vld1q_u8(dk + 16*r)));
+		s = veorq_u8(vaesdq_u8(s, vld1q_u8(dk + 16)), vld1q_u8(dk));
+		vst1q_u8(out + 16*b, veorq_u8(s, prev));
+		prev = c;
+	}
+}
+#else
+static void solver_aes_prepare_dec(const uint8_t *rk, int rounds, uint8_t *dk) {}
+static void solver_aes_dec_cbc(const uint8_t *dk, int rounds, const uint8_t *iv, const uint8_t *in, uint8_t *out, int nblocks) {}
+#endif
+
+// =============================================================================
+// SIMD MD5 CHAIN (AVX2, 8 LANE)
+// =============================================================================
+// KDF mengulang MD5 atas digest 16 byte 9999x per blok (~90% waktu derive).
+// Pesan 16 byte selalu muat 1 blok MD5 dengan padding tetap (0x80, panjang 128 bit),
+// jadi 8 password dihitung bareng: 1 register ymm = 1 word state untuk 8 lane.
+#if defined(__x86_64__)
+#include <immintrin.h>
+#define SOLVER_MD5_X8 1
+#endif
+
+static int solver_cpu_has_avx2(void) {
+#if defined(SOLVER_MD5_X8)
+	__builtin_cpu_init();
+	return __builtin_cpu_supports("avx2");
+#else
+	return 0;
+#endif
+}
+
+#if defined(SOLVER_MD5_X8)
+#define MD5_ROTL(x, s) _mm256_or_si256(_mm256_slli_epi32((x), (s)), _mm256_srli_epi32((x), 32 - (s)))
+#define MD5_F(b, c, d) _mm256_xor_si256(d, _mm256_and_si256(b, _mm256_xor_si256(c, d)))
+#define MD5_G(b, c, d) _mm256_xor_si256(c, _mm256_and_si256(d, _mm256_xor_si256(b, c)))
+#define MD5_H(b, c, d) _mm256_xor_si256(_mm256_xor_si256(b, c), d)
+#define MD5_I(b, c, d) _mm256_xor_si256(c, _mm256_or_si256(b, _mm256_xor_si256(d, ones)))
+// a = b + rotl(a + f(b,c,d) + m + k, s); STEPZ = word pesan nol (padding)
+#define MD5_STEP(f, a, b, c, d, m, k, s) \
+	a = _mm256_add_epi32(b, MD5_ROTL(_mm256_add_epi32(_mm256_add_epi32(a, f(b, c, d)), _mm256_add_epi32(m, _mm256_set1_epi32((int)(k)))), s))
+#define MD5_STEPZ(f, a, b, c, d, k, s) \
+	a = _mm256_add_epi32(b, MD5_ROTL(_mm256_add_epi32(_mm256_add_epi32(a, f(b, c, d)), _mm256_set1_epi32((int)(k))), s))
+
+// dig = 8 digest berurutan (8 x 16 byte); tiap lane: dig = MD5(dig), diulang iters kali
+__attribute__((target("avx2")))
+static void solver_md5_chain_x8(uint8_t *dig, int iters) {
+	const __m256i ones = _mm256_set1_epi32(-1);
+	const __m256i iva = _mm256_set1_epi32(0x67452301), ivb = _mm256_set1_epi32((int)0xefcdab89);
+	const __m256i ivc = _mm256_set1_epi32((int)0x98badcfe), ivd = _mm256_set1_epi32(0x10325476);
+	const __m256i m4 = _mm256_set1_epi32(0x80), m14 = _mm256_set1_epi32(128);
+	const __m256i idx = _mm256_setr_epi32(0, 4, 8, 12, 16, 20, 24, 28); // stride 16 byte antar lane
+	__m256i w0 = _mm256_i32gather_epi32((const int *)(dig + 0), idx, 4);
+	__m256i w1 = _mm256_i32gather_epi32((const int *)(dig + 4), idx, 4);
+	__m256i w2 = _mm256_i32gather_epi32((const int *)(dig + 8), idx, 4);
+	__m256i w3 = _mm256_i32gather_epi32((const int *)(dig + 12), idx, 4);
+	for (int it = 0; it < iters; it++) {
+		__m256i a = iva, b = ivb, c = ivc, d = ivd;
+		MD5_STEP(MD5_F, a, b, c, d, w0, 0xd76aa478, 7); MD5_STEP(MD5_F, d, a, b, c, w1, 0xe8c7b756, 12); MD5_STEP(MD5_F, c, d, a, b, w2, 0x242070db, 17); MD5_STEP(MD5_F, b, c, d, a, w3, 0xc1bdceee, 22);
+		MD5_STEP(MD5_F, a, b, c, d, m4, 0xf57c0faf, 7); MD5_STEPZ(MD5_F, d, a, b, c, 0x4787c62a, 12); MD5_STEPZ(MD5_F, c, d, a, b, 0xa8304613, 17); MD5_STEPZ(MD5_F, b, c, d, a, 0xfd469501, 22);
+		MD5_STEPZ(MD5_F, a, b, c, d, 0x698098d8, 7); MD5_STEPZ(MD5_F, d, a, b, c, 0x8b44f7af, 12); MD5_STEPZ(MD5_F, c, d, a, b, 0xffff5bb1, 17); MD5_STEPZ(MD5_F, b, c, d, a, 0x895cd7be, 22);
+		MD5_STEPZ(MD5_F, a, b, c, d, 0x6b901122, 7); MD5_STEPZ(MD5_F, d, a, b, c, 0xfd987193, 12); MD5_STEP(MD5_F, c, d, a, b, m14, 0xa679438e, 17); MD5_STEPZ(MD5_F, b, c, d, a, 0x49b40821, 22);
+		MD5_STEP(MD5_G, a, b, c, d, w1, 0xf61e2562, 5); MD5_STEPZ(MD5_G, d, a, b, c, 0xc040b340, 9); MD5_STEPZ(MD5_G, c, d, a, b, 0x265e5a51, 14); MD5_STEP(MD5_G, b, c, d, a, w0, 0xe9b6c7aa, 20);
+		MD5_STEPZ(MD5_G, a, b, c, d, 0xd62f105d, 5); MD5_STEPZ(MD5_G, d, a, b, c, 0x02441453, 9); MD5_STEPZ(MD5_G, c, d, a, b, 0xd8a1e681, 14); MD5_STEP(MD5_G, b, c, d, a, m4, 0xe7d3fbc8, 20);
+		MD5_STEPZ(MD5_G, a, b, c, d, 0x21e1cde6, 5); MD5_STEP(MD5_G, d, a, b, c, m14, 0xc33707d6, 9); MD5_STEP(MD5_G, c, d, a, b, w3, 0xf4d50d87, 14); MD5_STEPZ(MD5_G, b, c, d, a, 0x455a14ed, 20);
+		MD5_STEPZ(MD5_G, a, b, c, d, 0xa9e3e905, 5); MD5_STEP(MD5_G, d, a, b, c, w2, 0xfcefa3f8, 9); MD5_STEPZ(MD5_G, c, d, a, b, 0x676f02d9, 14); MD5_STEPZ(MD5_G, b, c, d, a, 0x8d2a4c8a, 20);
+		MD5_STEPZ(MD5_H, a, b, c, d, 0xfffa3942, 4); MD5_STEPZ(MD5_H, d, a, b, c, 0x8771f681, 11); MD5_STEPZ(MD5_H, c, d, a, b, 0x6d9d6122, 16); MD5_STEP(MD5_H, b, c, d, a, m14, 0xfde5380c, 23);
+		MD5_STEP(MD5_H, a, b, c, d, w1, 0xa4beea44, 4); MD5_STEP(MD5_H, d, a, b, c, m4, 0x4bdecfa9, 11); MD5_STEPZ(MD5_H, c, d, a, b, 0xf6bb4b60, 16); MD5_STEPZ(MD5_H, b, c, d, a, 0xbebfbc70, 23);
+		MD5_STEPZ(MD5_H, a, b, c, d, 0x289b7ec6, 4); MD5_STEP(MD5_H, d, a, b, c, w0, 0xeaa127fa, 11); MD5_STEP(MD5_H, c, d, a, b, w3, 0xd4ef3085, 16); MD5_STEPZ(MD5_H, b, c, d, a, 0x04881d05, 23);
+		MD5_STEPZ(MD5_H, a, b, c, d, 0xd9d4d039, 4); MD5_STEPZ(MD5_H, d, a, b, c, 0xe6db99e5, 11); MD5_STEPZ(MD5_H, c, d, a, b, 0x1fa27cf8, 16); MD5_STEP(MD5_H, b, c, d, a, w2, 0xc4ac5665, 23);
+		MD5_STEP(MD5_I, a, b, c, d, w0, 0xf4292244, 6); MD5_STEPZ(MD5_I, d, a, b, c, 0x432aff97, 10); MD5_STEP(MD5_I, c, d, a, b, m14, 0xab9423a7, 15); MD5_STEPZ(MD5_I, b, c, d, a, 0xfc93a039, 21);
+		MD5_STEPZ(MD5_I, a, b, c, d, 0x655b59c3, 6); MD5_STEP(MD5_I, d, a, b, c, w3, 0x8f0ccc92, 10); MD5_STEPZ(MD5_I, c, d, a, b, 0xffeff47d, 15); MD5_STEP(MD5_I, b, c, d, a, w1, 0x85845dd1, 21);
+		MD5_STEPZ(MD5_I, a, b, c, d, 0x6fa87e4f, 6); MD5_STEPZ(MD5_I, d, a, b, c, 0xfe2ce6e0, 10); MD5_STEPZ(MD5_I, c, d, a, b, 0xa3014314, 15); MD5_STEPZ(MD5_I, b, c, d, a, 0x4e0811a1, 21);
+		MD5_STEP(MD5_I, a, b, c, d, m4, 0xf7537e82, 6); MD5_STEPZ(MD5_I, d, a, b, c, 0xbd3af235, 10); MD5_STEP(MD5_I, c, d, a, b, w2, 0x2ad7d2bb, 15); MD5_STEPZ(MD5_I, b, c, d, a, 0xeb86d391, 21);
+		w0 = _mm256_add_epi32(a, iva); w1 = _mm256_add_epi32(b, ivb);
+		w2 = _mm256_add_epi32(c, ivc); w3 = _mm256_add_epi32(d, ivd);
+	}
+	uint32_t out[4][8];
+	_mm256_storeu_si256((__m256i *)out[0], w0); _mm256_storeu_si256((__m256i *)out[1], w1);
+	_mm256_storeu_si256((__m256i *)out[2], w2); _mm256_storeu_si256((__m256i *)out[3], w3);
+	for (int l = 0; l < 8; l++)
+		for (int j = 0; j < 4; j++) {
+			uint32_t v = out[j][l];
+			dig[16*l + 4*j] = v; dig[16*l + 4*j + 1] = v >> 8; dig[16*l + 4*j + 2] = v >> 16; dig[16*l + 4*j + 3] = v >> 24;
+		}
+}
+#else
+static void solver_md5_chain_x8(uint8_t *dig, int iters) {}
+#endif
+
+// =============================================================================
+// SIMD SHA-512 CHAIN (AVX2, 4 LANE)
+// =============================================================================
+// SHA-NI cuma ada untuk SHA-1/SHA-256; KDF ini pakai SHA-512 (11513x atas digest 64 byte).
+// Setelah MD5 jalan 8 lane, chain SHA-512 jadi porsi terbesar waktu derive. Input 64 byte
+// selalu 1 blok dengan padding tetap (0x80.., panjang 512 bit), jadi 4 password dihitung
+// bareng: 1 register ymm = 1 word 64-bit state untuk 4 lane.
+#if defined(SOLVER_MD5_X8)
+#define SOLVER_SHA512_X4 1
+static const uint64_t solver_sha512_k[80] = {
+	0x428a2f98d728ae22ULL, 0x7137449123ef65cdULL, 0xb5c0fbcfec4d3b2fULL, 0xe9b5dba58189dbbcULL,
+	0x3956c25bf348b538ULL, 0x59f111f1b605d019ULL, 0x923f82a4af194f9bULL, 0xab1c5ed5da6d8118ULL,
+	0xd807aa98a3030242ULL, 0x12835b0145706fbeULL, 0x243185be4ee4b28cULL, 0x550c7dc3d5ffb4e2ULL,
+	0x72be5d74f27b896fULL, 0x80deb1fe3b1696b1ULL, 0x9bdc06a725c71235ULL, 0xc19bf174cf692694ULL,
+	0xe49b69c19ef14ad2ULL, 0xefbe4786384f25e3ULL, 0x0fc19dc68b8cd5b5ULL, 0x240ca1cc77ac9c65ULL,
+	0x2de92c6f592b0275ULL, 0x4a7484aa6ea6e483ULL, 0x5cb0a9dcbd41fbd4ULL, 0x76f988da831153b5ULL,
+	0x983e5152ee66dfabULL, 0xa831c66d2db43210ULL, 0xb00327c898fb213fULL, 0xbf597fc7beef0ee4ULL,
+	0xc6e00bf33da88fc2ULL, 0xd5a79147930aa725ULL, 0x06ca6351e003826fULL, 0x142929670a0e6e70ULL,
+	0x27b70a8546d22ffcULL, 0x2e1b21385c26c926ULL, 0x4d2c6dfc5ac42aedULL, 0x53380d139d95b3dfULL,
+	0x650a73548baf63deULL, 0x766a0abb3c77b2a8ULL, 0x81c2c92e47edaee6ULL, 0x92722c851482353bULL,
+	0xa2bfe8a14cf10364ULL, 0xa81a664bbc423001ULL, 0xc24b8b70d0f89791ULL, 0xc76c51a30654be30ULL,
+	0xd192e819d6ef5218ULL, 0xd69906245565a910ULL, 0xf40e35855771202aULL, 0x106aa07032bbd1b8ULL,
+	0x19a4c116b8d2d0c8ULL, 0x1e376c085141ab53ULL, 0x2748774cdf8eeb99ULL, 0x34b0bcb5e19b48a8ULL,
+	0x391c0cb3c5c95a63ULL, 0x4ed8aa4ae3418acbULL, 0x5b9cca4f7763e373ULL, 0x682e6ff3d6b2b8a3ULL,
+	0x748f82ee5defb2fcULL, 0x78a5636f43172f60ULL, 0x84c87814a1f0ab72ULL, 0x8cc702081a6439ecULL,
+	0x90befffa23631e28ULL, 0xa4506cebde82bde9ULL, 0xbef9a3f7b2c67915ULL, 0xc67178f2e372532bULL,
+	0xca273eceea26619cULL, 0xd186b8c721c0c207ULL, 0xeada7dd6cde0eb1eULL, 0xf57d4f7fee6ed178ULL,
+	0x06f067aa72176fbaULL, 0x0a637dc5a2c898a6ULL, 0x113f9804bef90daeULL, 0x1b710b35131c471bULL,
+	0x28db77f523047d84ULL, 0x32caab7b40c72493ULL, 0x3c9ebe0a15c9bebcULL, 0x431d67c49c100d4cULL,
+	0x4cc5d4becb3e42b6ULL, 0x597f299cfc657e2aULL, 0x5fcb6fab3ad6faecULL, 0x6c44198c4a475817ULL,
+};
+static const uint64_t solver_sha512_iv[8] = {
+	0x6a09e667f3bcc908ULL, 0xbb67ae8584caa73bULL, 0x3c6ef372fe94f82bULL, 0xa54ff53a5f1d36f1ULL,
+	0x510e527fade682d1ULL, 0x9b05688c2b3e6c1fULL, 0x1f83d9abfb41bd6bULL, 0x5be0cd19137e2179ULL,
+};
+#define SHA_ROTR(x, s) _mm256_or_si256(_mm256_srli_epi64((x), (s)), _mm256_slli_epi64((x), 64 - (s)))
+
+// dig = 4 digest berurutan (4 x 64 byte); tiap lane: dig = SHA512(dig), diulang iters kali
+__attribute__((target("avx2")))
+static void solver_sha512_chain_x4(uint8_t *dig, int iters) {
+	__m256i h[8], w[16], iv[8];
+	for (int j = 0; j < 8; j++) {
+		uint64_t v[4];
+		for (int l = 0; l < 4; l++) { memcpy(&v[l], dig + 64*l + 8*j, 8); v[l] = __builtin_bswap64(v[l]); }
+		h[j] = _mm256_setr_epi64x((long long)v[0], (long long)v[1], (long long)v[2], (long long)v[3]);
+		iv[j] = _mm256_set1_epi64x((long long)solver_sha512_iv[j]);
+	}
+	for (int it = 0; it < iters; it++) {
+		for (int j = 0; j < 8; j++) w[j] = h[j];
+		w[8] = _mm256_set1_epi64x((long long)0x8000000000000000ULL);
+		for (int j = 9; j < 15; j++) w[j] = _mm256_setzero_si256();
+		w[15] = _mm256_set1_epi64x(512);
+		__m256i a = iv[0], b = iv[1], c = iv[2], d = iv[3], e = iv[4], f = iv[5], g = iv[6], hh = iv[7];
+		for (int t = 0; t < 80; t++) {
+			__m256i wt;
+			if (t < 16) wt = w[t];
+			else {
+				__m256i w15 = w[(t - 15) & 15], w2 = w[(t - 2) & 15];
+				__m256i s0 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(w15, 1), SHA_ROTR(w15, 8)), _mm256_srli_epi64(w15, 7));
+				__m256i s1 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(w2, 19), SHA_ROTR(w2, 61)), _mm256_srli_epi64(w2, 6));
+				wt = w[t & 15] = _mm256_add_epi64(_mm256_add_epi64(w[t & 15], s0), _mm256_add_epi64(w[(t - 7) & 15], s1));
+			}
+			__m256i S1 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(e, 14), SHA_ROTR(e, 18)), SHA_ROTR(e, 41));
+			__m256i ch = _mm256_xor_si256(g, _mm256_and_si256(e, _mm256_xor_si256(f, g)));
+			__m256i t1 = _mm256_add_epi64(_mm256_add_epi64(hh, S1), _mm256_add_epi64(ch, _mm256_add_epi64(wt, _mm256_set1_epi64x((long long)solver_sha512_k[t]))));
+			__m256i S0 = _mm256_xor_si256(_mm256_xor_si256(SHA_ROTR(a, 28), SHA_ROTR(a, 34)), SHA_ROTR(a, 39));
+			__m256i maj = _mm256_or_si256(_mm256_and_si256(a, b), _mm256_and_si256(c, _mm256_or_si256(a, b)));
+			hh = g; g = f; f = e; e = _mm256_add_epi64(d, t1);
+			d = c; c = b; b = a; a = _mm256_add_epi64(t1, _mm256_add_epi64(S0, maj));
+		}
+		h[0] = _mm256_add_epi64(a, iv[0]); h[1] = _mm256_add_epi64(b, iv[1]);
+		h[2] = _mm256_add_epi64(c, iv[2]); h[3] = _mm256_add_epi64(d, iv[3]);
+		h[4] = _mm256_add_epi64(e, iv[4]); h[5] = _mm256_add_epi64(f, iv[5]);
+		h[6] = _mm256_add_epi64(g, iv[6]); h[7] = _mm256_add_epi64(hh, iv[7]);
+	}
+	for (int j = 0; j < 8; j++) {
+		uint64_t v[4];
+		_mm256_storeu_si256((__m256i *)v, h[j]);
+		for (int l = 0; l < 4; l++) { v[l] = __builtin_bswap64(v[l]); memcpy(dig + 64*l + 8*j, &v[l], 8); }
+	}
+}
+#else
+static void solver_sha512_chain_x4(uint8_t *dig, int iters) {}
+#endif
+
+#line 1 "cgo-generated-wrapper"
 
 
 /* End of preamble from import "C" comments.  */
@@ -73,6 +330,25 @@ extern "C" {
 // 4. MAIN CHECK FUNCTION (MULTI-PATTERN)
 // =============================================================================
 extern int CheckPassword(char* passC, unsigned char* saltC, unsigned char* cipherC, int cipherLen);
+extern int HasAESNI();
+extern void SetHeaderPrefilter(int on);
+
+// =============================================================================
+// 5. BLOCK CHECK (PERMUTASI DI SISI GO)
+// =============================================================================
+// CheckPermutationBlock mengerjakan 1 blok penuh: semua urutan UNIK kata sisa di
+// belakang prefix tetap (kata kembar tidak menghasilkan urutan dobel). Python
+// cukup 1x panggil per blok, tidak ada lagi encode + ctypes marshaling per password.
+// Return: 1 = match (urutan index ditulis ke outMatchIdx), 0 = habis, -1 = argumen invalid.
+extern int CheckPermutationBlock(char** wordsC, int nWords, int r, int* prefixC, int prefixLen, unsigned char* saltC, unsigned char* cipherC, int cipherLen, int* outMatchIdx, long long int* outChecked);
+
+// =============================================================================
+// 6. BATCH CHECK (VECTOR API)
+// =============================================================================
+// CheckPasswordBatch mengecek n password dalam 1x panggilan ctypes (overhead
+// marshaling + GIL dibagi n). Password ke-i = pwBuf[offsets[i]:offsets[i+1]],
+// jadi offsets berisi n+1 entri. Return: index password yang match, -1 = tidak ada.
+extern int CheckPasswordBatch(unsigned char* pwBuf, unsigned int* offsets, int n, unsigned char* saltC, unsigned char* cipherC, int cipherLen);
 
 #ifdef __cplusplus
 }